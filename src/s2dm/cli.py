@@ -484,9 +484,9 @@ def vspec(
     )
     assert_correct_schema(annotated_schema.schema)
 
-    result = translate_to_vspec(annotated_schema)
     output.parent.mkdir(parents=True, exist_ok=True)
-    _ = output.write_text(result)
+    with open(output, "w", encoding="utf-8") as output_file:
+        translate_to_vspec(annotated_schema, output_file)
 
 
 # Export -> json schema
@@ -1,7 +1,8 @@
+import json
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, TextIO, TypeVar
 
 from graphql import GraphQLField
 from pydantic import BaseModel, field_validator
@@ -102,6 +103,36 @@ class ConceptBaseModel(JsonLDSerializable, Generic[NodeType]):
     context: dict[str, Any]
     graph: list[NodeType]
 
+    def write_json_ld(self, fp: TextIO) -> None:
+        """Write the model to a file in JSON-LD format.
+
+        The output is the same as `json.dump(model.to_json_ld(), fp, indent=2)`, but the graph nodes
+        are serialized one at a time, so that the whole document is never held in memory at once.
+
+        Args:
+            fp: Text file to write to
+        """
+        items: list[tuple[str, Any]] = list(
+            self.model_dump(by_alias=True, exclude_none=True, exclude={"graph"}).items()
+        )
+        # Keep the graph at its position in the dumped model, right after the context
+        items.insert(1, ("@graph", None))
+
+        fp.write("{")
+        for index, (key, value) in enumerate(items):
+            fp.write(f"{',' if index else ''}\n  {json.dumps(key)}: ")
+            if key != "@graph":
+                fp.write(json.dumps(value, indent=2).replace("\n", "\n  "))
+            elif not self.graph:
+                fp.write("[]")
+            else:
+                fp.write("[")
+                for node_index, node in enumerate(self.graph):
+                    node_json = json.dumps(node.to_json_ld(), indent=2).replace("\n", "\n    ")
+                    fp.write(f"{',' if node_index else ''}\n    {node_json}")
+                fp.write("\n  ]")
+        fp.write("\n}")
+
     def get_node_by_id(self, node_id: str) -> NodeType | None:
         """Get a node by its ID.
 
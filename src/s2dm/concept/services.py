@@ -2,7 +2,7 @@ import json
 from pathlib import Path
 from typing import Any
 
-from graphql import GraphQLEnumType, GraphQLList, GraphQLNamedType, GraphQLObjectType
+from graphql import GraphQLEnumType, GraphQLList, GraphQLNamedType, GraphQLObjectType, get_named_type
 
 from s2dm import log
 from s2dm.concept.models import (
@@ -46,8 +46,7 @@ def save_spec_history(spec_history: SpecHistoryModel, file_path: Path) -> None:
         file_path: Path where to save the file
     """
     with open(file_path, "w") as f:
-        # Use by_alias=True to ensure proper JSON-LD attribute names (@id, @type, etc.)
-        json.dump(spec_history.to_json_ld(), f, indent=2)
+        spec_history.write_json_ld(f)
 
 
 def create_jsonld_context(namespace: str, include_spec_history: bool = False) -> dict[str, Any]:
@@ -275,42 +274,50 @@ def iter_all_concepts(named_types: list[GraphQLNamedType]) -> Concepts:
         Concepts object containing all extracted concepts plus field metadata
     """
     concepts = Concepts()
+    # Bind the containers filled in the loop to locals, as they are used for every field
+    enums = concepts.enums
+    nested_objects = concepts.nested_objects
+    field_metadata = concepts.field_metadata
+
     for named_type in named_types:
-        if is_introspection_or_root_type(named_type.name):
+        type_name = named_type.name
+        if is_introspection_or_root_type(type_name):
             continue
 
         if isinstance(named_type, GraphQLEnumType):
-            log.debug(f"Processing enum: {named_type.name}")
-            concepts.enums.append(named_type.name)
+            log.debug("Processing enum: %s", type_name)
+            enums.append(type_name)
 
         elif isinstance(named_type, GraphQLObjectType):
-            log.debug(f"Processing object: {named_type.name}")
+            log.debug("Processing object: %s", type_name)
+            # Fields using a scalar or enum type, added to the concepts once all fields are processed,
+            # so that objects without such fields get no entry
+            object_fields: list[str] = []
+
             # Get the ID of all fields in the object
             for field_name, field in named_type.fields.items():
                 if is_id_type(field_name):
                     continue
 
-                field_fqn = f"{named_type.name}.{field_name}"
+                field_fqn = f"{type_name}.{field_name}"
+                field_type = field.type
 
-                if isinstance(field.type, GraphQLObjectType):
+                if isinstance(field_type, GraphQLObjectType):
                     # field uses the object type
-                    concepts.nested_objects[field_fqn] = field.type.name
-                elif isinstance(field.type, GraphQLList):
+                    nested_objects[field_fqn] = field_type.name
+                elif isinstance(field_type, GraphQLList):
                     # field uses a list of the object type
-                    internal_type = field.type
-                    while hasattr(internal_type, "of_type"):
-                        internal_type = internal_type.of_type
-                    # Get the name from the internal type if it has one
-                    internal_type_name = getattr(internal_type, "name", None)
-                    if internal_type_name:
-                        concepts.nested_objects[field_fqn] = internal_type_name
+                    nested_objects[field_fqn] = get_named_type(field_type).name
                 else:
                     # field uses a scalar type or enum type
-                    concepts.objects[named_type.name].append(field_fqn)
-                    concepts.fields.append(field_fqn)
+                    object_fields.append(field_fqn)
                     # Enhanced metadata for advanced functionality (SKOS generation, etc.)
-                    concepts.field_metadata[field_fqn] = FieldMetadata(
-                        object_name=named_type.name, field_name=field_name, field_definition=field
+                    field_metadata[field_fqn] = FieldMetadata(
+                        object_name=type_name, field_name=field_name, field_definition=field
                     )
 
+            if object_fields:
+                concepts.objects[type_name].extend(object_fields)
+                concepts.fields.extend(object_fields)
+
     return concepts
@@ -1,4 +1,4 @@
-import json
+import sys
 from pathlib import Path
 
 from s2dm import log
@@ -39,7 +39,8 @@ def process_schema(
     if output:
         with open(output, "w", encoding="utf-8") as output_file:
             log.info(f"Writing data to '{output}'")
-            json.dump(concept_uri_model.to_json_ld(), output_file, indent=2)
+            concept_uri_model.write_json_ld(output_file)
     else:
         print("-" * 80)
-        print(json.dumps(concept_uri_model.to_json_ld(), indent=2))
+        concept_uri_model.write_json_ld(sys.stdout)
+        print()
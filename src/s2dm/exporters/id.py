@@ -2,7 +2,7 @@ import json
 import sys
 from collections.abc import Generator
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from graphql import (
     GraphQLEnumType,
@@ -13,11 +13,29 @@ from graphql import (
 
 from s2dm import log
 from s2dm.exporters.utils.extraction import get_all_named_types
-from s2dm.exporters.utils.graphql_type import is_id_type, is_introspection_or_root_type
+from s2dm.exporters.utils.graphql_type import is_introspection_or_root_type
 from s2dm.idgen.idgen import fnv1_32_wrapper
 from s2dm.idgen.models import IDGenerationSpec
 
 
+def write_node_ids(node_ids: dict[str, str], fp: TextIO) -> None:
+    """Write the generated IDs to a file in JSON format.
+
+    The output is the same as `json.dump(node_ids, fp, indent=2)`. Since the mapping is flat, the indentation
+    is produced by the item separator, which keeps the C encoder that `json` skips when indenting.
+
+    Args:
+        node_ids: Generated IDs by node name
+        fp: Text file to write to
+    """
+    if not node_ids:
+        fp.write("{}")
+        return
+
+    entries = json.dumps(node_ids, separators=(",\n  ", ": "))
+    fp.write(f"{{\n  {entries[1:-1]}\n}}")
+
+
 class IDExporter:
     def __init__(
         self,
@@ -47,16 +65,7 @@ class IDExporter:
             elif isinstance(named_type, GraphQLObjectType):
                 log.debug(f"Processing object: {named_type.name}")
                 # Get the ID of all fields in the object
-                for field_name, field in named_type.fields.items():
-                    if is_id_type(field_name):
-                        continue
-
-                    id_spec = IDGenerationSpec.from_field(
-                        parent_name=f"{named_type.name}",
-                        field_name=field_name,
-                        field=field,
-                    )
-
+                for id_spec in IDGenerationSpec.from_object_fields(object_type=named_type):
                     # Only yield leaf fields
                     if id_spec.is_leaf_field():
                         yield id_spec
@@ -67,24 +76,26 @@ class IDExporter:
 
         all_named_types = get_all_named_types(schema=self.schema)
 
-        node_ids = {}
-        existing_ids = set()
+        node_ids: dict[str, str] = {}
+        # Names of the nodes by their generated ID, to report which node already holds a duplicate ID
+        names_by_id: dict[str, str] = {}
         for id_spec in self.iter_all_id_specs(named_types=all_named_types):
             generated_id = fnv1_32_wrapper(id_spec, strict_mode=self.strict_mode)
 
-            if generated_id in existing_ids:
-                log.warning(f"Duplicate ID found: {generated_id} for {id_spec.name}")
+            existing_name = names_by_id.get(generated_id)
+            if existing_name is not None:
+                log.warning(f"Duplicate ID found: {generated_id} for {id_spec.name} (already used by {existing_name})")
                 sys.exit(1)
 
-            existing_ids.add(generated_id)
+            names_by_id[generated_id] = id_spec.name
             node_ids[id_spec.name] = generated_id
 
-            log.debug(f"Type path: {id_spec.name} -> {id_spec.data_type} -> {generated_id}")
+            log.debug("Type path: %s -> %s -> %s", id_spec.name, id_spec.data_type, generated_id)
 
         # Write the schema to the output file
         if not self.dry_run and self.output is not None:
             with open(self.output, "w", encoding="utf-8") as output_file:
                 log.info(f"Writing data to '{self.output}'")
-                json.dump(node_ids, output_file, indent=2)
+                write_node_ids(node_ids, output_file)
 
         return node_ids
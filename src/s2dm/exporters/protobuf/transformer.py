@@ -50,23 +50,25 @@ GRAPHQL_SCALAR_TO_PROTOBUF = {
     "UInt64": "uint64",
 }
 
-PROTOBUF_RESERVED_KEYWORDS = {
-    "message",
-    "enum",
-    "service",
-    "rpc",
-    "option",
-    "import",
-    "package",
-    "syntax",
-    "reserved",
-    "oneof",
-    "repeated",
-    "optional",
-    "required",
-}
+PROTOBUF_RESERVED_KEYWORDS = frozenset(
+    {
+        "message",
+        "enum",
+        "service",
+        "rpc",
+        "option",
+        "import",
+        "package",
+        "syntax",
+        "reserved",
+        "oneof",
+        "repeated",
+        "optional",
+        "required",
+    }
+)
 
-PROTOBUF_DATA_TYPES = set(GRAPHQL_SCALAR_TO_PROTOBUF.values())
+PROTOBUF_DATA_TYPES = frozenset(GRAPHQL_SCALAR_TO_PROTOBUF.values())
 
 
 class ProtobufTransformer:
@@ -1,5 +1,10 @@
+import itertools
+import logging
 from dataclasses import dataclass
+from dataclasses import field as dataclass_field
+from functools import lru_cache
 from typing import cast
+from uuid import uuid4
 
 from graphql import (
     GraphQLEnumType,
@@ -17,14 +22,15 @@ from s2dm.exporters.utils.annotated_schema import AnnotatedSchema
 from s2dm.exporters.utils.directive import get_argument_content
 from s2dm.exporters.utils.extraction import get_all_object_types
 from s2dm.exporters.utils.field import Cardinality, FieldCase, get_cardinality, get_field_case_extended, print_field_sdl
-from s2dm.exporters.utils.graphql_type import is_introspection_or_root_type
 
-SUPPORTED_FIELD_CASES = {
-    FieldCase.DEFAULT,
-    FieldCase.NON_NULL,
-    FieldCase.SET,
-    FieldCase.SET_NON_NULL,
-}
+SUPPORTED_FIELD_CASES = frozenset(
+    {
+        FieldCase.DEFAULT,
+        FieldCase.NON_NULL,
+        FieldCase.SET,
+        FieldCase.SET_NON_NULL,
+    }
+)
 
 
 @dataclass
@@ -33,14 +39,48 @@ class Namespaces:
     shapes_prefix: Namespace
     model: Namespace
     model_prefix: Namespace
+    # IRIs built from the namespaces, cached since the same type names are referenced by many fields
+    _shape_iris: dict[str, URIRef] = dataclass_field(default_factory=dict, init=False, repr=False)
+    _model_iris: dict[str, URIRef] = dataclass_field(default_factory=dict, init=False, repr=False)
+
+    def shape(self, name: str) -> URIRef:
+        """Get the IRI of a name in the shapes namespace."""
+        iri = self._shape_iris.get(name)
+        if iri is None:
+            iri = self._shape_iris[name] = self.shapes[name]
+        return iri
+
+    def model_iri(self, name: str) -> URIRef:
+        """Get the IRI of a name in the model namespace."""
+        iri = self._model_iris.get(name)
+        if iri is None:
+            iri = self._model_iris[name] = self.model[name]
+        return iri
 
 
 # Datatype mapping from GraphQL to XSD
 GRAPHQL_SCALAR_TO_XSD = {"Int": "integer", "Float": "float", "String": "string", "Boolean": "boolean", "ID": "string"}
+SCALAR_TO_XSD_URI: dict[str, URIRef] = {name: XSD[datatype] for name, datatype in GRAPHQL_SCALAR_TO_XSD.items()}
+
+# Blank node identifiers are drawn from a counter behind a per-process random prefix,
+# which keeps them unique without generating a UUID for every node
+BNODE_PREFIX = f"N{uuid4().hex[:16]}"
+_bnode_serials = itertools.count()
+
+
+@lru_cache(maxsize=4096)
+def name_literal(name: str) -> Literal:
+    """Get the literal of a type or field name, cached since field names recur across types."""
+    return Literal(name)
+
+
+def new_bnode() -> BNode:
+    """Create a new blank node with a unique identifier."""
+    return BNode(f"{BNODE_PREFIX}{next(_bnode_serials)}")
 
 
 def get_xsd_datatype(scalar: GraphQLScalarType) -> URIRef:
-    return XSD[GRAPHQL_SCALAR_TO_XSD.get(scalar.name, "string")]
+    return SCALAR_TO_XSD_URI.get(scalar.name, XSD.string)
 
 
 def add_comment_to_property_node(field: GraphQLField, property_node: BNode, graph: Graph) -> None:
@@ -69,17 +109,13 @@ def translate_to_shacl(
     graph.bind(namespaces.shapes_prefix, namespaces.shapes)
     graph.bind(namespaces.model_prefix, namespaces.model)
 
-    object_types = get_all_object_types(schema)
-    log.debug(f"Object types: {object_types}")
+    object_types = get_all_object_types(schema, skip_root_types=True)
+    log.debug("Object types: %s", object_types)
 
     for object_type in object_types:
-        if is_introspection_or_root_type(object_type.name):
-            log.debug(f"Skipping internal object type '{object_type.name}'.")
-            continue
-
         type_metadata = annotated_schema.type_metadata.get(object_type.name)
         if type_metadata and type_metadata.is_intermediate_type:
-            log.debug(f"Skipping intermediate type '{object_type.name}'.")
+            log.debug("Skipping intermediate type '%s'.", object_type.name)
             continue
 
         process_object_type(namespaces, object_type, graph, schema, annotated_schema)
@@ -95,11 +131,11 @@ def process_object_type(
     annotated_schema: AnnotatedSchema,
 ) -> None:
     """Process a GraphQL object type and generate the corresponding SHACL triples."""
-    log.debug(f"Processing object type '{object_type.name}'.")
-    shape_node = namespaces.shapes[object_type.name]
+    log.debug("Processing object type '%s'.", object_type.name)
+    shape_node = namespaces.shape(object_type.name)
     _ = graph.add((shape_node, RDF.type, SH.NodeShape))
-    _ = graph.add((shape_node, SH.name, Literal(object_type.name)))
-    _ = graph.add((shape_node, SH.targetClass, namespaces.model[object_type.name]))
+    _ = graph.add((shape_node, SH.name, name_literal(object_type.name)))
+    _ = graph.add((shape_node, SH.targetClass, namespaces.model_iri(object_type.name)))
     if object_type.description:
         _ = graph.add((shape_node, SH.description, Literal(object_type.description)))
 
@@ -119,10 +155,10 @@ def create_property_shape_with_literal(
     scalar_type = get_named_type(field.type)
     if not isinstance(scalar_type, GraphQLScalarType) and not isinstance(scalar_type, GraphQLEnumType):
         raise ValueError(f"Expected GraphQLScalarType or GraphQLEnumType, got {type(scalar_type).__name__}")
-    property_path = namespaces.model[f"{field_name}"]
-    property_node = BNode()
+    property_path = namespaces.model_iri(field_name)
+    property_node = new_bnode()
     _ = graph.add((shape_node, SH.property, property_node))
-    _ = graph.add((property_node, SH.name, Literal(field_name)))
+    _ = graph.add((property_node, SH.name, name_literal(field_name)))
     _ = graph.add((property_node, SH.path, property_path))
     _ = graph.add((property_node, SH.nodeKind, SH.Literal))
 
@@ -138,7 +174,7 @@ def create_property_shape_with_literal(
 
     if enum_values is not None:
         # Create an RDF Collection for the enum values
-        enum_list_node = BNode()
+        enum_list_node = new_bnode()
         _ = graph.add((property_node, SH["in"], enum_list_node))
         enum_literals = [Literal(val) for val in enum_values]
         _ = Collection(graph, enum_list_node, cast(list[Node], enum_literals))
@@ -160,14 +196,14 @@ def create_property_shape_with_iri(
 ) -> None:
     unwrapped_output_type = target_type if target_type else get_named_type(field.type)
 
-    property_node = BNode()
-    property_path = namespaces.model["has" + unwrapped_output_type.name]
+    property_node = new_bnode()
+    property_path = namespaces.model_iri("has" + unwrapped_output_type.name)
     _ = graph.add((shape_node, SH.property, property_node))
-    _ = graph.add((property_node, SH.name, Literal(field_name)))
+    _ = graph.add((property_node, SH.name, name_literal(field_name)))
     _ = graph.add((property_node, SH.path, property_path))
     _ = graph.add((property_node, SH.nodeKind, SH.IRI))
-    _ = graph.add((property_node, SH.node, namespaces.shapes[unwrapped_output_type.name]))
-    _ = graph.add((property_node, SH["class"], namespaces.model[unwrapped_output_type.name]))
+    _ = graph.add((property_node, SH.node, namespaces.shape(unwrapped_output_type.name)))
+    _ = graph.add((property_node, SH["class"], namespaces.model_iri(unwrapped_output_type.name)))
     if value_cardinality:
         if value_cardinality.min:
             _ = graph.add((property_node, SH.minCount, Literal(value_cardinality.min, datatype=XSD.integer)))
@@ -191,35 +227,41 @@ def process_field(
     annotated_schema: AnnotatedSchema,
 ) -> None:
     """Process a field of a GraphQL object type and generate the corresponding SHACL triples."""
-    log.debug(f"Processing field... '{print_field_sdl(field)}'")
+    # Printing the field SDL is costly, so only do it when the message is emitted
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Processing field... '%s'", print_field_sdl(field))
     field_case = get_field_case_extended(field)
-    log.debug(f"Field case: {field_case}")
+    log.debug("Field case: %s", field_case)
     if field_case not in SUPPORTED_FIELD_CASES:
         log.warning(
-            f"""Field case '{field_case.name}' is currently not supported by this exporter.
-            Supported field cases are: {[case.name for case in SUPPORTED_FIELD_CASES]}.
-            Skipping field '{field_name}'."""
+            """Field case '%s' is currently not supported by this exporter.
+            Supported field cases are: %s.
+            Skipping field '%s'.""",
+            field_case.name,
+            [case.name for case in SUPPORTED_FIELD_CASES],
+            field_name,
         )
         return None
 
     field_metadata = annotated_schema.field_metadata.get((parent_type.name, field_name))
     if field_metadata and field_metadata.is_expanded:
         if not field_metadata.original_field:
-            log.warning(f"Expanded field '{field_name}' has no original_field")
+            log.warning("Expanded field '%s' has no original_field", field_name)
             return None
 
         original_field_case = get_field_case_extended(field_metadata.original_field)
         if original_field_case in (FieldCase.LIST, FieldCase.LIST_NON_NULL):
             log.debug(
-                f"Skipping expanded field '{field_name}' with original case '{original_field_case.name}'. "
-                f"SHACL exporter does not support LIST fields."
+                "Skipping expanded field '%s' with original case '%s'. SHACL exporter does not support LIST fields.",
+                field_name,
+                original_field_case.name,
             )
             return None
 
-        log.debug(f"Field '{field_name}' is expanded with {len(field_metadata.resolved_names)} instances")
+        log.debug("Field '%s' is expanded with %d instances", field_name, len(field_metadata.resolved_names))
         resolved_type_obj = schema.type_map.get(field_metadata.resolved_type)
         if not isinstance(resolved_type_obj, GraphQLObjectType):
-            log.warning(f"Resolved type '{field_metadata.resolved_type}' is not a GraphQLObjectType")
+            log.warning("Resolved type '%s' is not a GraphQLObjectType", field_metadata.resolved_type)
             return None
 
         spec_cardinality = get_cardinality(field_metadata.original_field)
@@ -242,12 +284,14 @@ def process_field(
     if isinstance(unwrapped_field_type, GraphQLObjectType):
         target_type_metadata = annotated_schema.type_metadata.get(unwrapped_field_type.name)
         if target_type_metadata and target_type_metadata.is_intermediate_type:
-            log.debug(f"Skipping field '{field_name}' that points to intermediate type '{unwrapped_field_type.name}'")
+            log.debug(
+                "Skipping field '%s' that points to intermediate type '%s'", field_name, unwrapped_field_type.name
+            )
             return None
 
     spec_cardinality = get_cardinality(field)
     value_cardinality = spec_cardinality if spec_cardinality else field_case.value.value_cardinality
-    log.debug(f"Unwrapped field type: {unwrapped_field_type}")
+    log.debug("Unwrapped field type: %s", unwrapped_field_type)
 
     if field_case == FieldCase.DEFAULT or field_case == FieldCase.NON_NULL:
         if isinstance(unwrapped_field_type, GraphQLScalarType):
@@ -1,7 +1,9 @@
 import re
+from collections.abc import Mapping
 from typing import Any
 
 from graphql import (
+    ConstDirectiveNode,
     FloatValueNode,
     GraphQLEnumType,
     GraphQLField,
@@ -17,6 +19,38 @@ from graphql.language.ast import StringValueNode
 
 GRAPHQL_TYPE_DEFINITION_PATTERN = r"^(type|interface|input|enum|union|scalar)\s+(\w+)"
 
+# Sentinel for attributes that are not present on an AST node
+_MISSING = object()
+
+
+def get_directives_by_name(element: GraphQLObjectType | GraphQLField) -> Mapping[str, ConstDirectiveNode]:
+    """
+    Get the directives of a GraphQL element (field, object type) indexed by their name.
+
+    The mapping is built from the current directives of the AST node on every call, so it is meant for
+    callers looking up several directives of an element. Use `get_directive` to look up a single one.
+    For repeated directives, the first occurrence is kept.
+    """
+    ast_node = element.ast_node
+    if not ast_node or not ast_node.directives:
+        return {}
+
+    directives_by_name: dict[str, ConstDirectiveNode] = {}
+    for directive in ast_node.directives:
+        directives_by_name.setdefault(directive.name.value, directive)
+    return directives_by_name
+
+
+def get_directive(element: GraphQLObjectType | GraphQLField, directive_name: str) -> ConstDirectiveNode | None:
+    """Get the first directive with the given name of a GraphQL element (field, object type), if any."""
+    ast_node = element.ast_node
+    if not ast_node or not ast_node.directives:
+        return None
+    for directive in ast_node.directives:
+        if directive.name.value == directive_name:
+            return directive
+    return None
+
 
 def get_directive_arguments(element: GraphQLField | GraphQLObjectType, directive_name: str) -> dict[str, Any]:
     """
@@ -27,34 +61,41 @@ def get_directive_arguments(element: GraphQLField | GraphQLObjectType, directive
     Returns:
         dict[str, Any]: A dictionary containing the directive arguments with proper type conversion.
     """
-    if not has_given_directive(element, directive_name) or not element.ast_node:
+    directive = get_directive(element, directive_name)
+    if directive is None:
         return {}
+    return get_directive_node_arguments(directive)
+
 
-    directive = next(d for d in element.ast_node.directives if d.name.value == directive_name)
+def get_directive_node_arguments(directive: ConstDirectiveNode) -> dict[str, Any]:
+    """
+    Extracts the arguments of a directive node.
+    Args:
+        directive: The directive node whose arguments are to be extracted.
+    Returns:
+        dict[str, Any]: A dictionary containing the directive arguments with proper type conversion.
+    """
     args: dict[str, Any] = {}
 
     for arg in directive.arguments:
         arg_name = arg.name.value
-        if hasattr(arg.value, "value"):
-            if isinstance(arg.value, IntValueNode):
-                args[arg_name] = int(arg.value.value)
-            elif isinstance(arg.value, FloatValueNode):
-                args[arg_name] = float(arg.value.value)
-            else:
-                args[arg_name] = arg.value.value
+        value_node = arg.value
+        value: Any = getattr(value_node, "value", _MISSING)
+        if value is _MISSING:
+            args[arg_name] = value_node
+        elif isinstance(value_node, IntValueNode):
+            args[arg_name] = int(value)
+        elif isinstance(value_node, FloatValueNode):
+            args[arg_name] = float(value)
         else:
-            args[arg_name] = arg.value
+            args[arg_name] = value
 
     return args
 
 
 def has_given_directive(element: GraphQLObjectType | GraphQLField, directive_name: str) -> bool:
     """Check whether a GraphQL element (field, object type) has a particular specified directive."""
-    if element.ast_node and element.ast_node.directives:
-        for directive in element.ast_node.directives:
-            if directive.name.value == directive_name:
-                return True
-    return False
+    return get_directive(element, directive_name) is not None
 
 
 def get_argument_content(
@@ -12,7 +12,7 @@ from graphql import (
 )
 
 from s2dm.exporters.utils.directive import has_given_directive
-from s2dm.exporters.utils.graphql_type import is_introspection_type
+from s2dm.exporters.utils.graphql_type import is_introspection_or_root_type, is_introspection_type
 
 
 def get_all_named_types(schema: GraphQLSchema) -> list[GraphQLNamedType]:
@@ -30,16 +30,22 @@ def get_all_named_types(schema: GraphQLSchema) -> list[GraphQLNamedType]:
 
 def get_all_object_types(
     schema: GraphQLSchema,
+    skip_root_types: bool = False,
 ) -> list[GraphQLObjectType]:
     """
     Extracts all object types from the provided GraphQL schema.
     Args:
         schema (GraphQLSchema): The GraphQL schema to extract object types from.
+        skip_root_types (bool): Whether to leave out the root operation types (Query, Mutation, Subscription).
     Returns:
         list[GraphQLObjectType]: A list of all object types in the schema.
     """
-    named_types = get_all_named_types(schema)
-    return [type_ for type_ in named_types if isinstance(type_, GraphQLObjectType)]
+    is_skipped = is_introspection_or_root_type if skip_root_types else is_introspection_type
+    return [
+        type_
+        for type_ in schema.type_map.values()
+        if isinstance(type_, GraphQLObjectType) and not is_skipped(type_.name)
+    ]
 
 
 def get_all_objects_with_directive(objects: list[GraphQLObjectType], directive_name: str) -> list[GraphQLObjectType]:
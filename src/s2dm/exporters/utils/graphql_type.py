@@ -1,17 +1,38 @@
-def is_introspection_type(type_name: str) -> bool:
-    return type_name.startswith("__")
-
+# Prefix reserved for the names of introspection types (e.g. __Schema, __Type)
+INTROSPECTION_TYPE_PREFIX = "__"
 
-def is_root_type(type_name: str) -> bool:
-    return type_name in {
+ROOT_TYPE_NAMES = frozenset(
+    {
         "Query",
         "Mutation",
         "Subscription",
     }
+)
+
+BUILTIN_SCALAR_TYPE_NAMES = frozenset(
+    {
+        "ID",
+        "String",
+        "Int",
+        "Float",
+        "Boolean",
+    }
+)
+
+# Names of non-introspection types that are part of GraphQL itself
+_SYSTEM_TYPE_NAMES = ROOT_TYPE_NAMES | BUILTIN_SCALAR_TYPE_NAMES
+
+
+def is_introspection_type(type_name: str) -> bool:
+    return type_name.startswith(INTROSPECTION_TYPE_PREFIX)
+
+
+def is_root_type(type_name: str) -> bool:
+    return type_name in ROOT_TYPE_NAMES
 
 
 def is_introspection_or_root_type(type_name: str) -> bool:
-    return is_introspection_type(type_name) or is_root_type(type_name)
+    return type_name in ROOT_TYPE_NAMES or type_name.startswith(INTROSPECTION_TYPE_PREFIX)
 
 
 def is_id_type(type_name: str) -> bool:
@@ -19,14 +40,8 @@ def is_id_type(type_name: str) -> bool:
 
 
 def is_builtin_scalar_type(type_name: str) -> bool:
-    return type_name in {
-        "ID",
-        "String",
-        "Int",
-        "Float",
-        "Boolean",
-    }
+    return type_name in BUILTIN_SCALAR_TYPE_NAMES
 
 
 def is_graphql_system_type(type_name: str) -> bool:
-    return is_introspection_or_root_type(type_name) or is_builtin_scalar_type(type_name)
+    return type_name in _SYSTEM_TYPE_NAMES or type_name.startswith(INTROSPECTION_TYPE_PREFIX)
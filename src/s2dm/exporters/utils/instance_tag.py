@@ -171,25 +171,29 @@ def is_expandable_field(field: GraphQLField, schema: GraphQLSchema) -> bool:
 
 def _collect_expandable_fields(
     schema: GraphQLSchema,
-) -> list[tuple[GraphQLObjectType, str]]:
+) -> tuple[list[tuple[GraphQLObjectType, str]], list[GraphQLObjectType]]:
     """
-    Collect all fields in the schema that need instance expansion.
+    Collect all fields in the schema that need instance expansion, together with all
+    object types that carry the @instanceTag directive, in a single pass over the object types.
 
     Args:
         schema: The GraphQL schema to scan
 
     Returns:
-        List of tuples: (parent_type, field_name)
+        Tuple of (list of (parent_type, field_name) tuples, list of instance tag object types)
     """
     expandable_fields = []
+    instance_tag_types = []
     all_object_types = get_all_object_types(schema)
 
     for object_type in all_object_types:
+        if has_given_directive(object_type, "instanceTag"):
+            instance_tag_types.append(object_type)
         for field_name, field in object_type.fields.items():
             if is_expandable_field(field, schema):
                 expandable_fields.append((object_type, field_name))
 
-    return expandable_fields
+    return expandable_fields, instance_tag_types
 
 
 def _create_intermediate_types(
@@ -258,7 +262,7 @@ def expand_instances_in_schema(
     """
     log.info("Starting instance expansion in schema")
 
-    expandable_fields = _collect_expandable_fields(schema)
+    expandable_fields, all_instance_tag_types = _collect_expandable_fields(schema)
     log.info(f"Found {len(expandable_fields)} expandable fields")
 
     base_types_to_clean: set[GraphQLObjectType] = set()
@@ -333,7 +337,6 @@ def expand_instances_in_schema(
         base_types_to_clean.add(base_type)
 
     all_types_to_remove = set(instance_tag_types_to_remove)
-    all_instance_tag_types = get_all_objects_with_directive(get_all_object_types(schema), "instanceTag")
     all_types_to_remove.update(t.name for t in all_instance_tag_types)
 
     for base_type in base_types_to_clean:
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +16,7 @@ from graphql import (
 )
 
 from s2dm import log
+from s2dm.exporters.utils.directive import has_given_directive
 from s2dm.exporters.utils.graphql_type import is_graphql_system_type
 
 CASE_CONVERTERS = {
@@ -28,6 +30,12 @@ CASE_CONVERTERS = {
     "TitleCase": titlecase,
 }
 
+# The LibYAML based loader is much faster than the pure Python one, so use it when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 TYPE_CONTEXTS = {
     GraphQLObjectType: "object",
     GraphQLInterfaceType: "interface",
@@ -38,9 +46,12 @@ TYPE_CONTEXTS = {
 }
 
 
+@lru_cache(maxsize=4096)
 def convert_name(name: str, target_case: str) -> str:
     """Convert a name to the specified case format.
 
+    Results are memoized, since the same names (e.g. field names) recur across many types.
+
     Args:
         name: The name to convert
         target_case: The target case format (e.g., "camelCase", "PascalCase", "snake_case")
@@ -81,6 +92,18 @@ def apply_naming_to_schema(schema: GraphQLSchema, naming_config: dict[str, Any])
         naming_config: Configuration dictionary specifying case conversions for different element types
     """
 
+    # The target cases only depend on the naming config, so resolve them once instead of per type
+    case_table: dict[tuple[str, str], str | None] = {
+        ("type", context): get_target_case_for_element("type", context, naming_config)
+        for context in TYPE_CONTEXTS.values()
+    }
+    case_table.update(
+        (("field", context), get_target_case_for_element("field", context, naming_config))
+        for context in ("object", "interface", "input")
+    )
+    argument_case = get_target_case_for_element("argument", "field", naming_config)
+    enum_value_case = get_target_case_for_element("enumValue", "", naming_config)
+
     types_to_rename = []
     for type_name, type_obj in schema.type_map.items():
         if is_graphql_system_type(type_name):
@@ -88,16 +111,19 @@ def apply_naming_to_schema(schema: GraphQLSchema, naming_config: dict[str, Any])
 
         context = TYPE_CONTEXTS.get(type(type_obj))
         if context:
-            target_case = get_target_case_for_element("type", context, naming_config)
+            target_case = case_table[("type", context)]
             if target_case:
                 new_name = convert_name(type_name, target_case)
                 if new_name != type_name:
                     types_to_rename.append((type_name, new_name, type_obj))
 
         if isinstance(type_obj, GraphQLObjectType | GraphQLInterfaceType | GraphQLInputObjectType):
-            convert_field_names(type_obj, naming_config, schema)
-        elif isinstance(type_obj, GraphQLEnumType):
-            convert_enum_values(type_obj, naming_config)
+            field_case = case_table[("field", context)] if context else None
+            # Skip types for which neither the field names nor the argument names are converted
+            if field_case or (argument_case and context != "input"):
+                convert_field_names(type_obj, schema, field_case, argument_case)
+        elif isinstance(type_obj, GraphQLEnumType) and enum_value_case:
+            convert_enum_values(type_obj, enum_value_case)
 
     for old_name, new_name, type_obj in types_to_rename:
         del schema.type_map[old_name]
@@ -125,66 +151,62 @@ def is_instance_tag_field(field_name: str, field: Any, schema: GraphQLSchema) ->
     if not isinstance(target_type, GraphQLObjectType):
         return False
 
-    if target_type.ast_node and target_type.ast_node.directives:
-        for directive in target_type.ast_node.directives:
-            if directive.name.value == "instanceTag":
-                return True
-    return False
+    return has_given_directive(target_type, "instanceTag")
 
 
 def convert_field_names(
     type_obj: GraphQLObjectType | GraphQLInterfaceType | GraphQLInputObjectType,
-    naming_config: dict[str, Any],
     schema: GraphQLSchema,
+    field_case: str | None,
+    argument_case: str | None,
 ) -> None:
     """Convert field names and argument names for a GraphQL type object.
 
     Args:
         type_obj: The GraphQL type object to modify
-        naming_config: Configuration dictionary specifying case conversions
         schema: The GraphQL schema (used for instanceTag field detection)
+        field_case: Target case of the field names, or None to keep them
+        argument_case: Target case of the argument names, or None to keep them
     """
     context = TYPE_CONTEXTS.get(type(type_obj))
     if not context:
         return
 
-    target_case = get_target_case_for_element("field", context, naming_config)
-    if target_case:
+    if field_case:
         new_fields = {}
         for old_name, field in type_obj.fields.items():
             if is_instance_tag_field(old_name, field, schema):
                 new_fields[old_name] = field
             else:
-                new_name = convert_name(old_name, target_case)
+                new_name = convert_name(old_name, field_case)
                 new_fields[new_name] = field
 
         type_obj.fields.clear()
         type_obj.fields.update(new_fields)
 
-    if context in ("object", "interface"):
-        for field in type_obj.fields.values():
-            if hasattr(field, "args") and field.args:
-                # Convert argument names - need to update dictionary keys (args don't have .name attribute)
-                arg_target_case = get_target_case_for_element("argument", "field", naming_config)
-                if arg_target_case:
-                    new_args = {}
-                    for old_name, arg in field.args.items():
-                        new_name = convert_name(old_name, arg_target_case)
-                        new_args[new_name] = arg
+    if context not in ("object", "interface") or not argument_case:
+        return
+
+    for field in type_obj.fields.values():
+        if hasattr(field, "args") and field.args:
+            # Convert argument names - need to update dictionary keys (args don't have .name attribute)
+            new_args = {}
+            for old_name, arg in field.args.items():
+                new_name = convert_name(old_name, argument_case)
+                new_args[new_name] = arg
 
-                    # Replace the args dictionary
-                    field.args.clear()
-                    field.args.update(new_args)
+            # Replace the args dictionary
+            field.args.clear()
+            field.args.update(new_args)
 
 
-def convert_enum_values(type_obj: GraphQLEnumType, naming_config: dict[str, Any]) -> None:
+def convert_enum_values(type_obj: GraphQLEnumType, target_case: str | None) -> None:
     """Convert enum value names for a GraphQL enum type.
 
     Args:
         type_obj: The GraphQL enum type to modify
-        naming_config: Configuration dictionary specifying case conversions
+        target_case: Target case of the enum values, or None to keep them
     """
-    target_case = get_target_case_for_element("enumValue", "", naming_config)
     if not target_case:
         return
 
@@ -292,7 +314,7 @@ def load_naming_config(config_path: Path | None) -> dict[str, Any] | None:
         log.info(f"Loaded naming config: {config_path}")
 
         try:
-            result = yaml.safe_load(config_file_handle)
+            result = yaml.load(config_file_handle, Loader=SafeLoader)
         except yaml.YAMLError as e:
             raise ValueError(f"Failed to load naming config from {config_path}: {e}") from e
 
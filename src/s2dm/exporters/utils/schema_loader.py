@@ -329,8 +329,9 @@ def check_enum_defaults(schema: GraphQLSchema) -> list[str]:
     for type_name, type_obj in schema.type_map.items():
         # Validate directive usage on types
         if type_obj.ast_node and type_obj.ast_node.directives:
+            type_context = f"Type '{type_name}'"
             for directive_node in type_obj.ast_node.directives:
-                errors.extend(_check_directive_usage_on_node(schema, directive_node, f"Type '{type_name}'"))
+                errors.extend(_check_directive_usage_on_node(schema, directive_node, type_context))
 
         # Validate input object field defaults
         if isinstance(type_obj, GraphQLInputObjectType):
@@ -351,16 +352,17 @@ def check_enum_defaults(schema: GraphQLSchema) -> list[str]:
 
         # Validate field argument defaults and directive usage on fields
         if isinstance(type_obj, GraphQLObjectType | GraphQLInterfaceType | GraphQLInputObjectType):
+            # Only fields of object and interface types have arguments
+            has_field_args = isinstance(type_obj, GraphQLObjectType | GraphQLInterfaceType)
             for field_name, field in type_obj.fields.items():
                 # Validate directive usage on fields
                 if field.ast_node and field.ast_node.directives:
+                    field_context = f"Field '{type_name}.{field_name}'"
                     for directive_node in field.ast_node.directives:
-                        errors.extend(
-                            _check_directive_usage_on_node(schema, directive_node, f"Field '{type_name}.{field_name}'")
-                        )
+                        errors.extend(_check_directive_usage_on_node(schema, directive_node, field_context))
 
                 # Validate field argument defaults
-                if isinstance(type_obj, GraphQLObjectType | GraphQLInterfaceType):
+                if has_field_args:
                     for arg_name, arg in field.args.items():
                         named_type = get_named_type(arg.type)
                         if not isinstance(named_type, GraphQLEnumType):
@@ -417,15 +419,8 @@ def check_correct_schema(schema: GraphQLSchema) -> list[str]:
     spec_errors = validate_schema(schema)
     enum_errors = check_enum_defaults(schema)
 
-    all_errors: list[str] = []
-
-    if spec_errors:
-        for spec_error in spec_errors:
-            all_errors.append(f"  - {spec_error.message}")
-
-    if enum_errors:
-        for enum_error in enum_errors:
-            all_errors.append(f"  - {enum_error}")
+    all_errors = [f"  - {spec_error.message}" for spec_error in spec_errors]
+    all_errors.extend(f"  - {enum_error}" for enum_error in enum_errors)
 
     return all_errors
 
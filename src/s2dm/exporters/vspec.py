@@ -1,6 +1,9 @@
-from collections.abc import Iterable
+import io
+import re
+from collections.abc import Iterable, Mapping
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import IO, Any, overload
 
 import click
 import yaml
@@ -16,134 +19,139 @@ from graphql import (
 
 from s2dm import log
 from s2dm.exporters.utils.annotated_schema import AnnotatedSchema
-from s2dm.exporters.utils.directive import get_directive_arguments, has_given_directive
+from s2dm.exporters.utils.directive import get_directive, get_directive_arguments
 from s2dm.exporters.utils.extraction import get_all_object_types
 from s2dm.exporters.utils.field import FieldCase
-from s2dm.exporters.utils.graphql_type import is_introspection_or_root_type
 from s2dm.exporters.utils.schema_loader import load_schema_with_naming, process_schema
 
-UNITS_DICT = {  # TODO: move to a separate file or use the vss tools to get the mapping directly from dynamic_units
-    # Using the QUDT unit names
-    # LengthUnitEnum
-    "MILLIM": "mm",
-    "CENTIM": "cm",
-    "M": "m",
-    "METER": "m",
-    "KILOM": "km",
-    "IN": "inch",
-    # VelocityUnitEnum
-    "KILOM_PER_HR": "km/h",
-    "M_PER_SEC": "m/s",
-    # AccelerationUnitEnum
-    "M_PER_SEC2": "m/s^2",
-    "CENTIM_PER_SEC2": "cm/s^2",
-    # VolumeUnitEnum
-    "MILLIL": "ml",
-    "L": "l",  # Liter
-    "CENTIM3": "cm^3",
-    # TemperatureUnitEnum
-    "DEG_C": "celsius",
-    # AngleUnitEnum
-    "DEG": "degrees",
-    # AngularVelocityUnitEnum
-    "DEG_PER_SEC": "degrees/s",
-    "RAD_PER_SEC": "rad/s",
-    # PowerUnitEnum
-    "HP": "PS",  # Horsepower
-    # ElectricPowerUnitEnum
-    "W": "W",  # Watt
-    "KILOW": "kW",  # Kilowatt
-    # MassUnitEnum
-    "GM": "g",  # Gram
-    "KILOGM": "kg",  # Kilogram
-    "LB": "lbs",  # Pound
-    # ElectricPotentialUnitEnum
-    "V": "V",  # Volt
-    # DisplacementCurrentUnitEnum
-    "AMPERE": "A",
-    # ElectricChargeUnitEnum
-    "A_HR": "Ah",  # Ampere Hour
-    # TimeUnitEnum
-    "MILLISEC": "ms",  # Millisecond
-    "SEC": "s",  # Second
-    "MIN": "min",  # Minute
-    "HR": "h",  # Hour
-    "DAY": "day",  # Day
-    "WK": "weeks",  # Week
-    "MO": "months",  # Month
-    "YR": "years",  # Year
-    # ForcePerAreaUnitEnum
-    "MILLIBAR": "mbar",
-    "PA": "Pa",  # Pascal
-    "KILOPA": "kPa",  # Kilopascal
-    "PSI": "psi",  # Pound per square inch
-    # MassFlowRateUnitEnum
-    "GRAMS_PER_SECOND": "g/s",
-    # MassPerLengthUnitEnum
-    "GM_PER_KILOM": "g/km",
-    # VolumeFlowRateUnitEnum
-    "L_PER_HR": "l/h",
-    # ForceUnitEnum
-    "N": "N",  # Newton
-    "KILON": "kN",
-    # TorqueUnitEnum
-    "N_M": "Nm",  # Newton meter
-    # RotationalVelocityUnitEnum
-    "REV_PER_MIN": "rpm",
-    "HZ": "Hz",  # Hertz
-    # HeartRateUnitEnum
-    "BEAT_PER_MIN": "bpm",
-    # DimensionlessRatioUnitEnum
-    "PERCENT": "percent",
-    # UnknownUnitEnum
-    "DECIB_MILLIW": "dBm",
-    # SoundPowerLevelUnitEnum
-    "DECIB": "dB",
-    # ResistanceUnitEnum
-    "OHM": "Ohm",
-    # LuminousFluxPerAreaUnitEnum
-    "LUX": "lx",
-    # Custom units
-    "KILOWATT_HOURS": "kWh",
-    "UNIX_TIMESTAMP": "unix-time",
-    "ISO_8601": "iso8601",
-    "STARS": "stars",
-    "KILOWATT_HOURS_PER_100_KILOMETERS": "kWh/100km",
-    "WATT_HOUR_PER_KM": "Wh/km",
-    "MILLILITER_PER_100_KILOMETERS": "ml/100km",
-    "LITER_PER_100_KILOMETERS": "l/100km",
-    "MILES_PER_GALLON": "mpg",
-    "KILOMETERS_PER_LITER": "km/l",
-    "CYCLES_PER_MINUTE": "cpm",
-    "RATIO": "ratio",
-    "NANO_METER_PER_KILOMETER": "nm/km",
-}
-
-SUPPORTED_FIELD_CASES = {
-    FieldCase.DEFAULT,
-    FieldCase.NON_NULL,
-    FieldCase.LIST,
-    FieldCase.LIST_NON_NULL,
-    FieldCase.NON_NULL_LIST,
-    FieldCase.NON_NULL_LIST_NON_NULL,
-}
-
-SCALAR_DATATYPE_MAP = {
-    # Built-in scalar types
-    "Int": "int32",
-    "Float": "float",
-    "String": "string",
-    "Boolean": "boolean",
-    "ID": "string",
-    # Custom scalar types
-    "Int8": "int8",
-    "UInt8": "uint8",
-    "Int16": "int16",
-    "UInt16": "uint16",
-    "UInt32": "uint32",
-    "Int64": "int64",
-    "UInt64": "uint64",
-}
+UNITS_DICT: Mapping[str, str] = MappingProxyType(
+    {  # TODO: move to a separate file or use the vss tools to get the mapping directly from dynamic_units
+        # Using the QUDT unit names
+        # LengthUnitEnum
+        "MILLIM": "mm",
+        "CENTIM": "cm",
+        "M": "m",
+        "METER": "m",
+        "KILOM": "km",
+        "IN": "inch",
+        # VelocityUnitEnum
+        "KILOM_PER_HR": "km/h",
+        "M_PER_SEC": "m/s",
+        # AccelerationUnitEnum
+        "M_PER_SEC2": "m/s^2",
+        "CENTIM_PER_SEC2": "cm/s^2",
+        # VolumeUnitEnum
+        "MILLIL": "ml",
+        "L": "l",  # Liter
+        "CENTIM3": "cm^3",
+        # TemperatureUnitEnum
+        "DEG_C": "celsius",
+        # AngleUnitEnum
+        "DEG": "degrees",
+        # AngularVelocityUnitEnum
+        "DEG_PER_SEC": "degrees/s",
+        "RAD_PER_SEC": "rad/s",
+        # PowerUnitEnum
+        "HP": "PS",  # Horsepower
+        # ElectricPowerUnitEnum
+        "W": "W",  # Watt
+        "KILOW": "kW",  # Kilowatt
+        # MassUnitEnum
+        "GM": "g",  # Gram
+        "KILOGM": "kg",  # Kilogram
+        "LB": "lbs",  # Pound
+        # ElectricPotentialUnitEnum
+        "V": "V",  # Volt
+        # DisplacementCurrentUnitEnum
+        "AMPERE": "A",
+        # ElectricChargeUnitEnum
+        "A_HR": "Ah",  # Ampere Hour
+        # TimeUnitEnum
+        "MILLISEC": "ms",  # Millisecond
+        "SEC": "s",  # Second
+        "MIN": "min",  # Minute
+        "HR": "h",  # Hour
+        "DAY": "day",  # Day
+        "WK": "weeks",  # Week
+        "MO": "months",  # Month
+        "YR": "years",  # Year
+        # ForcePerAreaUnitEnum
+        "MILLIBAR": "mbar",
+        "PA": "Pa",  # Pascal
+        "KILOPA": "kPa",  # Kilopascal
+        "PSI": "psi",  # Pound per square inch
+        # MassFlowRateUnitEnum
+        "GRAMS_PER_SECOND": "g/s",
+        # MassPerLengthUnitEnum
+        "GM_PER_KILOM": "g/km",
+        # VolumeFlowRateUnitEnum
+        "L_PER_HR": "l/h",
+        # ForceUnitEnum
+        "N": "N",  # Newton
+        "KILON": "kN",
+        # TorqueUnitEnum
+        "N_M": "Nm",  # Newton meter
+        # RotationalVelocityUnitEnum
+        "REV_PER_MIN": "rpm",
+        "HZ": "Hz",  # Hertz
+        # HeartRateUnitEnum
+        "BEAT_PER_MIN": "bpm",
+        # DimensionlessRatioUnitEnum
+        "PERCENT": "percent",
+        # UnknownUnitEnum
+        "DECIB_MILLIW": "dBm",
+        # SoundPowerLevelUnitEnum
+        "DECIB": "dB",
+        # ResistanceUnitEnum
+        "OHM": "Ohm",
+        # LuminousFluxPerAreaUnitEnum
+        "LUX": "lx",
+        # Custom units
+        "KILOWATT_HOURS": "kWh",
+        "UNIX_TIMESTAMP": "unix-time",
+        "ISO_8601": "iso8601",
+        "STARS": "stars",
+        "KILOWATT_HOURS_PER_100_KILOMETERS": "kWh/100km",
+        "WATT_HOUR_PER_KM": "Wh/km",
+        "MILLILITER_PER_100_KILOMETERS": "ml/100km",
+        "LITER_PER_100_KILOMETERS": "l/100km",
+        "MILES_PER_GALLON": "mpg",
+        "KILOMETERS_PER_LITER": "km/l",
+        "CYCLES_PER_MINUTE": "cpm",
+        "RATIO": "ratio",
+        "NANO_METER_PER_KILOMETER": "nm/km",
+    }
+)
+
+SUPPORTED_FIELD_CASES = frozenset(
+    {
+        FieldCase.DEFAULT,
+        FieldCase.NON_NULL,
+        FieldCase.LIST,
+        FieldCase.LIST_NON_NULL,
+        FieldCase.NON_NULL_LIST,
+        FieldCase.NON_NULL_LIST_NON_NULL,
+    }
+)
+
+SCALAR_DATATYPE_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        # Built-in scalar types
+        "Int": "int32",
+        "Float": "float",
+        "String": "string",
+        "Boolean": "boolean",
+        "ID": "string",
+        # Custom scalar types
+        "Int8": "int8",
+        "UInt8": "uint8",
+        "Int16": "int16",
+        "UInt16": "uint16",
+        "UInt32": "uint32",
+        "Int64": "int64",
+        "UInt64": "uint64",
+    }
+)
 
 # TODO: Replace the mapping with the classes of graphql-core and the actual datatypes from the VSS tools.
 # SCALAR_DATATYPE_MAP = {
@@ -164,13 +172,60 @@ SCALAR_DATATYPE_MAP = {
 # }
 
 
-class CustomDumper(yaml.Dumper):
-    """Custom YAML dumper to add extra line breaks at the top level."""
+# Sentinel for attributes that are not present on an AST node
+_MISSING = object()
+
+# A (key, node) pair of the VSPEC output, e.g. ("Vehicle.speed", {"datatype": "float", ...})
+VSSEntry = tuple[str, dict[str, Any]]
+
+
+class FlowList(list[Any]):
+    """List that is always serialized in flow style (e.g., `[a, b]`)."""
+
+
+class BlockList(list[Any]):
+    """List that is always serialized in block style (one item per line)."""
+
+
+# The LibYAML based emitter is much faster than the pure Python one, so use it when PyYAML was built with it
+try:
+    from yaml import CDumper as BaseDumper
+except ImportError:
+    from yaml import Dumper as BaseDumper  # type: ignore[assignment]
+
+# Matches the line breaks followed by a top-level key, to separate the top-level entries by an empty line
+TOP_LEVEL_LINE_BREAK_PATTERN = re.compile(r"\n(?=\S)")
+
+
+class TopLevelLineBreakWriter:
+    """Text stream wrapper adding an empty line before every top-level entry of the YAML written to it.
 
-    def write_line_break(self, data: str | None = None) -> None:
-        super().write_line_break(data)
-        if len(self.indents) == 1:  # Only add extra line break at the top level
-            super().write_line_break()
+    The emitter writes the YAML in chunks, so a top-level key starting a chunk is recognized
+    by the line break that ended the previous one.
+    """
+
+    # The LibYAML emitter writes str instead of bytes to streams with an encoding attribute
+    encoding = None
+
+    def __init__(self, stream: IO[str]):
+        self.stream = stream
+        self.at_line_start = False
+
+    def write(self, data: str) -> None:
+        if not data:
+            return
+        if self.at_line_start and not data[0].isspace():
+            self.stream.write("\n")
+        self.stream.write(TOP_LEVEL_LINE_BREAK_PATTERN.sub("\n\n", data))
+        self.at_line_start = data.endswith("\n")
+
+
+class CustomDumper(BaseDumper):
+    """Custom YAML dumper serializing lists in flow or block style depending on their items.
+
+    The empty lines between the top-level entries are added by TopLevelLineBreakWriter,
+    since the LibYAML emitter cannot be hooked into.
+    """
 
     def represent_list(self, data: Iterable[Any]) -> yaml.SequenceNode:
         # Check if the list is an inner list (nested list)
@@ -181,48 +236,56 @@ class CustomDumper(yaml.Dumper):
             # Serialize outer lists in block style
             return super().represent_sequence("tag:yaml.org,2002:seq", data, flow_style=False)
 
+    def represent_flow_list(self, data: FlowList) -> yaml.SequenceNode:
+        return super().represent_sequence("tag:yaml.org,2002:seq", data, flow_style=True)
+
+    def represent_block_list(self, data: BlockList) -> yaml.SequenceNode:
+        return super().represent_sequence("tag:yaml.org,2002:seq", data, flow_style=False)
+
 
-# Register the custom representer for lists
+# Register the custom representers for lists.
+# Lists whose style is known upfront are tagged with FlowList or BlockList to skip the item check.
 CustomDumper.add_representer(list, CustomDumper.represent_list)
+CustomDumper.add_representer(FlowList, CustomDumper.represent_flow_list)
+CustomDumper.add_representer(BlockList, CustomDumper.represent_block_list)
 
 
-def translate_to_vspec(annotated_schema: AnnotatedSchema) -> str:
-    """Translate a GraphQL schema to YAML."""
+@overload
+def translate_to_vspec(annotated_schema: AnnotatedSchema, stream: None = None) -> str: ...
+
+
+@overload
+def translate_to_vspec(annotated_schema: AnnotatedSchema, stream: IO[str]) -> None: ...
+
+
+def translate_to_vspec(annotated_schema: AnnotatedSchema, stream: IO[str] | None = None) -> str | None:
+    """Translate a GraphQL schema to YAML.
+
+    If a stream is given, the YAML is written directly to it and None is returned.
+    Otherwise, the YAML is returned as a string.
+    """
     schema = annotated_schema.schema
 
-    all_object_types = get_all_object_types(schema)
+    all_object_types = get_all_object_types(schema, skip_root_types=True)
     log.debug(f"Object types: {all_object_types}")
     nested_types: list[tuple[str, str]] = []  # List to collect nested structures to reconstruct the path
-    yaml_dict = {}
+    branch_entries: list[VSSEntry] = []
+    field_entries: list[VSSEntry] = []
     for object_type in all_object_types:
-        if is_introspection_or_root_type(object_type.name):
-            log.debug(f"Skipping internal object type '{object_type.name}'.")
-            continue
-
         type_metadata = annotated_schema.type_metadata.get(object_type.name)
         if type_metadata and type_metadata.is_intermediate_type:
             log.debug(f"Skipping intermediate type '{object_type.name}'.")
             continue
 
-        # Add a VSS branch structure for the object type
-        if object_type.name not in yaml_dict:
-            log.debug(f"Processing object type '{object_type.name}'.")
-            obj_dict: dict[str, Any] = {"type": "branch"}
-            if object_type.description:
-                obj_dict["description"] = object_type.description
-            yaml_dict[object_type.name] = obj_dict
-        else:
-            log.debug(f"Object type '{object_type.name}' already exists in the YAML dictionary. Skipping.")
-        # Process the fields of the object type
-        for field_name, field in object_type.fields.items():
-            # Add a VSS leaf structure for the field
-            field_result = process_field(field_name, field, object_type, schema, nested_types, annotated_schema)
-            if field_result is not None:
-                yaml_dict.update(field_result)
-            else:
-                log.debug(
-                    f"Skipping field '{field_name}' in object type '{object_type.name}' as process_field returned None."
-                )
+        branch_entry, type_field_entries, type_nested_types = process_object_type(object_type, schema, annotated_schema)
+        branch_entries.append(branch_entry)
+        field_entries.extend(type_field_entries)
+        nested_types.extend(type_nested_types)
+
+    # Entries produced by fields take precedence over the plain branch of an object type,
+    # since they carry field-specific information such as the instances.
+    yaml_dict = dict(branch_entries)
+    yaml_dict.update(field_entries)
 
     log.debug(f"Nested types: {nested_types}")
     reconstructed_paths = reconstruct_paths(nested_types)
@@ -238,121 +301,188 @@ def translate_to_vspec(annotated_schema: AnnotatedSchema) -> str:
                 new_key = ".".join(path_parts[:-1] + [key])
                 yaml_dict[new_key] = yaml_dict.pop(key)
                 break
-    return yaml.dump(yaml_dict, default_flow_style=False, Dumper=CustomDumper, sort_keys=True)
+
+    # Sort the entries and their (flat) node dicts once here instead of letting the emitter sort every mapping
+    sorted_yaml_dict = {key: dict(sorted(node.items())) for key, node in sorted(yaml_dict.items())}
+    if stream is None:
+        string_stream = io.StringIO()
+        dump_vspec_yaml(sorted_yaml_dict, string_stream)
+        return string_stream.getvalue()
+    dump_vspec_yaml(sorted_yaml_dict, stream)
+    return None
+
+
+def dump_vspec_yaml(yaml_dict: dict[str, Any], stream: IO[str]) -> None:
+    """Dump the VSPEC entries as YAML to the given stream, separating the top-level entries by an empty line."""
+    yaml.dump(
+        yaml_dict, TopLevelLineBreakWriter(stream), default_flow_style=False, Dumper=CustomDumper, sort_keys=False
+    )
+
+
+def process_object_type(
+    object_type: GraphQLObjectType,
+    schema: GraphQLSchema,
+    annotated_schema: AnnotatedSchema,
+) -> tuple[VSSEntry, list[VSSEntry], list[tuple[str, str]]]:
+    """Process a GraphQL object type and its fields without touching any shared state.
+
+    Returns:
+        Tuple of (VSS branch entry of the object type, VSS entries of its fields, nested type relationships)
+    """
+    log.debug(f"Processing object type '{object_type.name}'.")
+    obj_dict: dict[str, Any] = {"type": "branch"}
+    if object_type.description:
+        obj_dict["description"] = object_type.description
+
+    field_entries: list[VSSEntry] = []
+    nested_types: list[tuple[str, str]] = []
+    field_name_prefix = object_type.name + "."
+    for field_name, field in object_type.fields.items():
+        # Add a VSS leaf structure for the field
+        field_entry = process_field(
+            field_name, field_name_prefix + field_name, field, object_type, schema, nested_types, annotated_schema
+        )
+        if field_entry is not None:
+            field_entries.append(field_entry)
+
+    return (object_type.name, obj_dict), field_entries, nested_types
+
+
+def _process_scalar_field(
+    concat_field_name: str,
+    field: GraphQLField,
+    output_type: GraphQLScalarType,
+) -> VSSEntry:
+    """Generate the VSS leaf of a field whose output type is a scalar."""
+    field_dict: dict[str, Any] = {
+        "description": field.description if field.description else "",
+        "datatype": SCALAR_DATATYPE_MAP[output_type.name],
+    }
+
+    # TODO: Fix numbers that are appearing with quotes as strings.
+    args = get_directive_arguments(field, "range")
+    if args:
+        datatype = field_dict["datatype"]
+        is_integer_type = "int" in datatype
+        is_float_type = datatype in ("float", "double")
+
+        if "min" in args:
+            if is_integer_type:
+                field_dict["min"] = int(args["min"])
+            elif is_float_type:
+                field_dict["min"] = float(args["min"])
+            else:
+                field_dict["min"] = args["min"]
+        if "max" in args:
+            if is_integer_type:
+                field_dict["max"] = int(args["max"])
+            elif is_float_type:
+                field_dict["max"] = float(args["max"])
+            else:
+                field_dict["max"] = args["max"]
+
+    # TODO: Map the unit name. i.e., SCREAMMING_SNAKE_CASE used in graphql to abbreviated vss unit name.
+    if "unit" in field.args:
+        unit_arg = field.args["unit"].default_value
+        if unit_arg is not None and unit_arg is not Undefined:
+            unit = UNITS_DICT.get(unit_arg)
+            if unit is not None:
+                field_dict["unit"] = unit
+
+    metadata_directive = get_directive(field, "metadata")
+    if metadata_directive:
+        # Only keep the arguments whose value node has a 'value' attribute (i.e., not lists or objects)
+        metadata_args = {
+            arg.name.value: value
+            for arg in metadata_directive.arguments or ()
+            if (value := getattr(arg.value, "value", _MISSING)) is not _MISSING
+        }
+
+        comment = metadata_args.get("comment")
+        vss_type = metadata_args.get("vssType")
+        if comment:
+            field_dict["comment"] = comment
+        if vss_type:
+            field_dict["type"] = vss_type
+
+    return concat_field_name, field_dict
+
+
+def _process_object_field(
+    field_name: str,
+    concat_field_name: str,
+    object_type: GraphQLObjectType,
+    schema: GraphQLSchema,
+    nested_types: list[tuple[str, str]],
+    annotated_schema: AnnotatedSchema,
+) -> VSSEntry | None:
+    """Generate the VSS branch of a field whose output type is an object type."""
+    # Get field_metadata to access resolved_type and instances
+    field_meta = annotated_schema.field_metadata.get((object_type.name, field_name))
+    if not field_meta:
+        log.debug(f"No field_metadata found for '{concat_field_name}'.")
+        return None
+
+    # Use resolved_type (skips intermediate types automatically)
+    resolved_type_name = field_meta.resolved_type
+    resolved_type_obj = schema.type_map.get(resolved_type_name)
+
+    if not isinstance(resolved_type_obj, GraphQLObjectType):
+        log.debug(f"Resolved type '{resolved_type_name}' is not a GraphQLObjectType.")
+        return None
+
+    # Record nested relationship using resolved type
+    nested_types.append((object_type.name, resolved_type_name))
+    log.debug(f"Nested structure found: {object_type.name}.{resolved_type_name} (for field {field_name})")
+
+    # Get instances from field_metadata
+    instances = field_meta.instances if field_meta.instances else None
+
+    # Create branch dict inline
+    obj_dict: dict[str, Any] = {"type": "branch"}
+    if resolved_type_obj.description:
+        obj_dict["description"] = resolved_type_obj.description
+    if instances:
+        obj_dict["instances"] = BlockList(FlowList(level) for level in instances)
+
+    return resolved_type_name, obj_dict
+
+
+def _process_enum_field(concat_field_name: str, field: GraphQLField) -> VSSEntry:
+    """Generate the VSS attribute of a field whose output type is an enum."""
+    field_dict = {
+        "description": field.description if field.description else "",
+        "datatype": "string",  # TODO: Consider that VSS allows any datatype for enums.
+        "allowed": FlowList(value.value for value in field.type.values.values())
+        if isinstance(field.type, GraphQLEnumType)
+        else FlowList(),
+        "type": "attribute",  # TODO: Get this from the @metadata directive.
+    }
+    return concat_field_name, field_dict
 
 
 def process_field(
     field_name: str,
+    concat_field_name: str,
     field: GraphQLField,
     object_type: GraphQLObjectType,
     schema: GraphQLSchema,
     nested_types: list[tuple[str, str]],
     annotated_schema: AnnotatedSchema,
-) -> dict[str, dict[str, Any]]:
+) -> VSSEntry | None:
     """Process a GraphQL field and generate the corresponding YAML."""
     log.debug(f"Processing field '{field_name}'.")
-    concat_field_name = f"{object_type.name}.{field_name}"
 
     output_type = get_named_type(field.type)
     if isinstance(output_type, GraphQLScalarType):
-        field_dict: dict[str, Any] = {
-            "description": field.description if field.description else "",
-            "datatype": SCALAR_DATATYPE_MAP[output_type.name],
-        }
-
-        # TODO: Fix numbers that are appearing with quotes as strings.
-        if has_given_directive(field, "range"):
-            args = get_directive_arguments(field, "range")
-            datatype = field_dict["datatype"]
-            is_integer_type = "int" in datatype
-            is_float_type = datatype in ("float", "double")
-
-            if "min" in args:
-                if is_integer_type:
-                    field_dict["min"] = int(args["min"])
-                elif is_float_type:
-                    field_dict["min"] = float(args["min"])
-                else:
-                    field_dict["min"] = args["min"]
-            if "max" in args:
-                if is_integer_type:
-                    field_dict["max"] = int(args["max"])
-                elif is_float_type:
-                    field_dict["max"] = float(args["max"])
-                else:
-                    field_dict["max"] = args["max"]
-
-        # TODO: Map the unit name. i.e., SCREAMMING_SNAKE_CASE used in graphql to abbreviated vss unit name.
-        if "unit" in field.args:
-            unit_arg = field.args["unit"].default_value
-            if unit_arg is not None and unit_arg is not Undefined and unit_arg in UNITS_DICT:
-                field_dict["unit"] = UNITS_DICT[unit_arg]
-
-        if has_given_directive(field, "metadata"):
-            metadata_directive = None
-            if field.ast_node and field.ast_node.directives:
-                metadata_directive = next(
-                    (directive for directive in field.ast_node.directives if directive.name.value == "metadata"), None
-                )
-
-            metadata_args = {}
-            if metadata_directive and metadata_directive.arguments:
-                for arg in metadata_directive.arguments:
-                    if hasattr(arg.value, "value"):  # Ensure arg.value has the 'value' attribute
-                        metadata_args[arg.name.value] = arg.value.value
-
-            comment = metadata_args.get("comment")
-            vss_type = metadata_args.get("vssType")
-            if comment:
-                field_dict["comment"] = comment
-            if vss_type:
-                field_dict["type"] = vss_type
-
-        return {concat_field_name: field_dict}
+        return _process_scalar_field(concat_field_name, field, output_type)
     elif isinstance(output_type, GraphQLObjectType):
-        # Get field_metadata to access resolved_type and instances
-        field_meta = annotated_schema.field_metadata.get((object_type.name, field_name))
-        if not field_meta:
-            log.debug(f"No field_metadata found for '{object_type.name}.{field_name}'.")
-            return {}
-
-        # Use resolved_type (skips intermediate types automatically)
-        resolved_type_name = field_meta.resolved_type
-        resolved_type_obj = schema.type_map.get(resolved_type_name)
-
-        if not isinstance(resolved_type_obj, GraphQLObjectType):
-            log.debug(f"Resolved type '{resolved_type_name}' is not a GraphQLObjectType.")
-            return {}
-
-        # Record nested relationship using resolved type
-        nested_types.append((object_type.name, resolved_type_name))
-        log.debug(f"Nested structure found: {object_type.name}.{resolved_type_name} (for field {field_name})")
-
-        # Get instances from field_metadata
-        instances = field_meta.instances if field_meta.instances else None
-
-        # Create branch dict inline
-        obj_dict: dict[str, Any] = {"type": "branch"}
-        if resolved_type_obj.description:
-            obj_dict["description"] = resolved_type_obj.description
-        if instances:
-            obj_dict["instances"] = instances
-
-        return {resolved_type_name: obj_dict}
+        return _process_object_field(field_name, concat_field_name, object_type, schema, nested_types, annotated_schema)
     elif isinstance(output_type, GraphQLEnumType):
-        field_dict = {
-            "description": field.description if field.description else "",
-            "datatype": "string",  # TODO: Consider that VSS allows any datatype for enums.
-            "allowed": [value.value for value in field.type.values.values()]
-            if isinstance(field.type, GraphQLEnumType)
-            else [],
-            "type": "attribute",  # TODO: Get this from the @metadata directive.
-        }
-        return {concat_field_name: field_dict}
-
+        return _process_enum_field(concat_field_name, field)
     else:
         log.debug(f"Skipping in the output: field '{field_name}' with output type '{type(field.type).__name__}'.")
-        return {}
+        return None
 
 
 def reconstruct_paths(nested_types: list[tuple[str, str]]) -> list[str]:
@@ -371,19 +501,18 @@ def reconstruct_paths(nested_types: list[tuple[str, str]]) -> list[str]:
     # Set to store unique paths
     unique_paths = set()
 
-    # Recursive function to build paths
-    def build_paths(current: str, path: list[str]) -> None:
-        # Add the current path to the unique paths set
+    # Walk the graph depth-first with an explicit stack, starting from each root node.
+    # Paths are kept as tuples so that a type already on the current path (i.e., a cycle) is skipped.
+    stack: list[tuple[str, tuple[str, ...]]] = [(root, (root,)) for root in root_nodes]
+    while stack:
+        current, path = stack.pop()
         unique_paths.add(".".join(path))
 
-        # If the current type has children, recurse
-        if current in graph:
-            for child in graph[current]:
-                build_paths(child, path + [child])
-
-    # Start building paths from each root node
-    for root in root_nodes:
-        build_paths(root, [root])
+        for child in graph.get(current, ()):
+            if child in path:
+                log.debug(f"Skipping cyclic reference to '{child}' in path '{'.'.join(path)}'.")
+                continue
+            stack.append((child, path + (child,)))
 
     # Return the sorted unique paths
     return sorted(unique_paths)
@@ -399,11 +528,9 @@ def main(
     # TODO: deprecate
     graphql_schema = load_schema_with_naming(schemas, None)
     annotated_schema = process_schema(graphql_schema, {}, None, None, None, False)
-    result = translate_to_vspec(annotated_schema)
-    log.info(f"Result:\n{result}")
     with open(output, "w", encoding="utf-8") as output_file:
         log.info(f"Writing data to '{output}'")
-        output_file.write(result)
+        translate_to_vspec(annotated_schema, output_file)
 
 
 if __name__ == "__main__":
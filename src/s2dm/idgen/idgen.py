@@ -9,8 +9,8 @@ def fnv1_32_hash(identifier: bytes) -> int:
     """
     id_hash = 2166136261
     for byte in identifier:
-        id_hash = (id_hash * 16777619) & 0xFFFFFFFF
-        id_hash ^= byte
+        # Multiply, truncate to 32 bits, then XOR the byte, in a single statement per byte
+        id_hash = ((id_hash * 16777619) & 0xFFFFFFFF) ^ byte
 
     return id_hash
 
@@ -23,4 +23,4 @@ def fnv1_32_wrapper(field: IDGenerationSpec, strict_mode: bool) -> str:
     @param strict_mode: strict mode means case sensitivity of node qualified names
     @return: a string representation of the ID hash
     """
-    return f"0x{format(fnv1_32_hash(field.get_node_identifier_bytes(strict_mode)), '08X')}"
+    return f"0x{fnv1_32_hash(field.get_node_identifier_bytes(strict_mode)):08X}"
@@ -1,3 +1,6 @@
+import logging
+import sys
+from collections.abc import Generator
 from dataclasses import dataclass
 from typing import Any
 
@@ -12,7 +15,8 @@ from graphql import (
 )
 
 from s2dm import log
-from s2dm.exporters.utils.directive import get_directive_arguments, has_given_directive
+from s2dm.exporters.utils.directive import get_directive_arguments
+from s2dm.exporters.utils.graphql_type import is_id_type
 
 
 class FieldTypeWrapper:
@@ -148,7 +152,7 @@ class IDGenerationSpec:
         Returns:
             Hash value for this instance
         """
-        return hash(f"{self.name}:{self.data_type}:{self.unit}:{self.allowed}:{self.minimum}:{self.maximum}")
+        return hash((self.name, self.data_type, self.unit, self.allowed, self.minimum, self.maximum))
 
     def is_object_type(self) -> bool:
         """Check if this field is an object type.
@@ -183,8 +187,7 @@ class IDGenerationSpec:
         Returns:
             a bytes representation of the node
         """
-
-        node_identifier: bytes = (
+        node_identifier = (
             f"{self.name}: "
             f"unit: {self.unit}, "
             f"datatype: {self.data_type}, "
@@ -193,12 +196,10 @@ class IDGenerationSpec:
             f"max: {self.maximum if self.maximum is not None else ''}"
         ).encode()
 
-        log.debug(f"{node_identifier=}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("node_identifier=%r", node_identifier)
 
-        if strict_mode:
-            return node_identifier
-        else:
-            return node_identifier.lower()
+        return node_identifier if strict_mode else node_identifier.lower()
 
     @classmethod
     def from_enum(
@@ -244,7 +245,6 @@ class IDGenerationSpec:
             parent_name: Parent name of the field
             field_name: the name of the field
             field: the GraphQL field to extract the ID generation spec from
-            unit_lookup: Dictionary mapping unit names to unit values
 
         Returns:
             an IDGenerationSpec
@@ -271,12 +271,12 @@ class IDGenerationSpec:
         allowed = IDGenerationSpec._resolve_allowed(inside_field_type_wrapped)
 
         # Unit is resolved from the field's "unit" argument (enum default value)
-        field_args = field.args or {}
-        unit = IDGenerationSpec._resolve_unit(field_args)
+        unit = IDGenerationSpec._resolve_unit(field.args) if field.args else ""
 
         # Minimum and maximum are resolved from the field's @range directive
-        minimum = IDGenerationSpec._resolve_minimum(field)
-        maximum = IDGenerationSpec._resolve_maximum(field)
+        range_args = IDGenerationSpec._resolve_range(field)
+        minimum = range_args.get("min")
+        maximum = range_args.get("max")
 
         return cls(
             name=name,
@@ -288,6 +288,30 @@ class IDGenerationSpec:
             _field_type=original_field_type_wrapped,
         )
 
+    @classmethod
+    def from_object_fields(
+        cls,
+        *,
+        object_type: GraphQLObjectType,
+    ) -> Generator["IDGenerationSpec", None, None]:
+        """Create the IDGenerationSpecs of the fields of a GraphQL object type.
+
+        Fields named like the ID type are skipped.
+
+        Args:
+            object_type: The GraphQL object type whose fields are processed
+
+        Yields:
+            an IDGenerationSpec per field
+        """
+        parent_name = object_type.name
+        from_field = cls.from_field
+        for field_name, field in object_type.fields.items():
+            if is_id_type(field_name):
+                continue
+
+            yield from_field(parent_name=parent_name, field_name=field_name, field=field)
+
     @staticmethod
     def _resolve_data_type(original_field_type: FieldTypeWrapper) -> str:
         """Resolve the data type from original and inside field types.
@@ -310,15 +334,15 @@ class IDGenerationSpec:
             # Use string for enum types
             field_type_name = "string"
 
-        surrounding_type = original_field_type
-        while surrounding_type.is_list_type():
-            field_type_name = f"{field_type_name}[]"
-            if hasattr(surrounding_type._field_type, "of_type"):
-                surrounding_type = FieldTypeWrapper(surrounding_type._field_type.of_type)
-            else:
-                break
+        # Count the directly nested list wrappers on the raw GraphQL type
+        surrounding_type = original_field_type._field_type
+        list_depth = 0
+        while isinstance(surrounding_type, GraphQLList):
+            list_depth += 1
+            surrounding_type = surrounding_type.of_type
 
-        return field_type_name
+        # Data types repeat across many fields, so share a single string per data type
+        return sys.intern(field_type_name + "[]" * list_depth)
 
     @staticmethod
     def _resolve_allowed(field: FieldTypeWrapper) -> str:
@@ -365,7 +389,7 @@ class IDGenerationSpec:
         Returns:
             The fully qualified name
         """
-        return f"{parent_name}.{field_name}"
+        return sys.intern(f"{parent_name}.{field_name}")
 
     @staticmethod
     def _resolve_range(
@@ -379,30 +403,4 @@ class IDGenerationSpec:
         Returns:
             Dictionary with range values or empty dict if no range directive
         """
-        if has_given_directive(field, "range"):
-            return get_directive_arguments(field, "range")
-        return {}
-
-    @staticmethod
-    def _resolve_minimum(field: GraphQLField) -> int | float | None:
-        """Resolve minimum value from range directive.
-
-        Args:
-            field: The GraphQL field
-
-        Returns:
-            The minimum value or None if not specified
-        """
-        return IDGenerationSpec._resolve_range(field).get("min")
-
-    @staticmethod
-    def _resolve_maximum(field: GraphQLField) -> int | float | None:
-        """Resolve maximum value from range directive.
-
-        Args:
-            field: The GraphQL field
-
-        Returns:
-            The maximum value or None if not specified
-        """
-        return IDGenerationSpec._resolve_range(field).get("max")
+        return get_directive_arguments(field, "range")
@@ -1,12 +1,15 @@
 """Unified logging system for S2DM with CLI output support."""
 
-import json
 import logging
 from typing import Any
 
 from rich.console import Console
 from rich.logging import RichHandler
 
+# Console and formatter shared by all S2DM loggers
+_CONSOLE = Console()
+_FORMATTER = logging.Formatter("%(message)s")
+
 
 class S2DMLogger(logging.Logger):
     """
@@ -25,7 +28,7 @@ class S2DMLogger(logging.Logger):
             level: Initial log level
         """
         super().__init__(name, level)
-        self.console = Console()
+        self.console = _CONSOLE
 
         # Add RichHandler for colored console output
         handler = RichHandler(
@@ -34,7 +37,7 @@ class S2DMLogger(logging.Logger):
             show_time=True,
             show_path=False,
         )
-        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler.setFormatter(_FORMATTER)
         self.addHandler(handler)
 
     def print(self, message: str) -> None:
@@ -94,12 +97,12 @@ class S2DMLogger(logging.Logger):
         """
         Print dictionary data with syntax highlighting.
 
-        The dictionary is converted to a JSON string and then printed with syntax highlighting.
+        The dictionary is serialized to JSON by Rich directly, without an intermediate JSON string.
 
         Args:
             data: Dictionary to display
         """
-        self.console.print_json(json.dumps(data, indent=2))
+        self.console.print_json(data=data, indent=2)
 
     def key_value(self, key: str, value: Any, key_style: str = "dim") -> None:
         """
@@ -139,17 +142,8 @@ def get_logger(name: str = "s2dm") -> S2DMLogger:
     Returns:
         S2DMLogger instance
     """
-    # Set custom logger class
+    # Set custom logger class, so that new loggers are created as S2DMLogger
     logging.setLoggerClass(S2DMLogger)
     logger = logging.getLogger(name)
 
-    # Only configure if not already configured
-    if not logger.handlers:
-        if isinstance(logger, S2DMLogger):
-            pass  # Already initialized in __init__
-        else:
-            # Convert to S2DMLogger if needed
-            logging.setLoggerClass(S2DMLogger)
-            logger = logging.getLogger(name)
-
     return logger  # type: ignore[return-value]
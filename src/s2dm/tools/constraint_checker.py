@@ -1,50 +1,93 @@
-from graphql import GraphQLEnumType, GraphQLObjectType, GraphQLSchema, get_named_type
+from graphql import GraphQLEnumType, GraphQLField, GraphQLObjectType, GraphQLOutputType, GraphQLSchema, get_named_type
 
-from s2dm.exporters.utils.directive import get_directive_arguments, has_given_directive
+from s2dm.exporters.utils.directive import get_directive_node_arguments, get_directives_by_name, has_given_directive
+
+# Directives whose min and max arguments are checked, in the order their errors are reported
+MIN_MAX_DIRECTIVES = ("range", "cardinality")
 
 
 class ConstraintChecker:
     def __init__(self, schema: GraphQLSchema):
         self.schema = schema
 
-    def check_min_leq_max(self, objects: list[GraphQLObjectType], directive: str) -> list[str]:
-        errors = []
+    @staticmethod
+    def _check_field_min_leq_max(
+        obj: GraphQLObjectType, fname: str, field: GraphQLField, errors_by_directive: dict[str, list[str]]
+    ) -> None:
+        """Check that min <= max for each directive of errors_by_directive present on the field."""
+        field_directives = get_directives_by_name(field)
+        if not field_directives:
+            return
+        for directive, errors in errors_by_directive.items():
+            directive_node = field_directives.get(directive)
+            if directive_node is None:
+                continue
+            args = get_directive_node_arguments(directive_node)
+            try:
+                min_val = args.get("min")
+                max_val = args.get("max")
+                if min_val is not None and max_val is not None and float(min_val) > float(max_val):
+                    errors.append(f"[{directive}] {obj.name}.{fname} has min > max ({min_val} > {max_val})")
+            except (ValueError, TypeError) as e:
+                errors.append(f"[{directive}] {obj.name}.{fname} has invalid min/max values: {e}")
+
+    def check_min_leq_max(self, objects: list[GraphQLObjectType], *directives: str) -> list[str]:
+        """Check that min <= max for the given directives in a single pass over the fields.
+
+        The errors are grouped by directive, in the order the directives are given.
+        """
+        errors_by_directive: dict[str, list[str]] = {directive: [] for directive in directives}
         for obj in objects:
             for fname, field in obj.fields.items():
-                if has_given_directive(field, directive):
-                    args = get_directive_arguments(field, directive)
-                    try:
-                        min_val = args.get("min")
-                        max_val = args.get("max")
-                        if min_val is not None and max_val is not None and float(min_val) > float(max_val):
-                            errors.append(f"[{directive}] {obj.name}.{fname} has min > max ({min_val} > {max_val})")
-                    except (ValueError, TypeError) as e:
-                        errors.append(f"[{directive}] {obj.name}.{fname} has invalid min/max values: {e}")
+                self._check_field_min_leq_max(obj, fname, field, errors_by_directive)
 
-        return errors
+        return [error for errors in errors_by_directive.values() for error in errors]
 
     def run(self, objects: list[GraphQLObjectType]) -> list[str]:
-        errors: list[str] = []
-        # instanceTag field rule
+        """Run all constraint checks in a single pass over the objects and their fields.
+
+        The errors are grouped by rule, in the order the rules are listed below.
+        """
+        instance_tag_field_errors: list[str] = []
+        instance_tag_object_errors: list[str] = []
+        min_max_errors: dict[str, list[str]] = {directive: [] for directive in MIN_MAX_DIRECTIVES}
+        check_field_min_leq_max = self._check_field_min_leq_max
+        # Whether an instanceTag field type references an @instanceTag object, shared by the objects using it
+        instance_tag_references: dict[GraphQLOutputType, bool] = {}
+
         for obj in objects:
-            if "instanceTag" in obj.fields:
-                field = obj.fields["instanceTag"]
-                output_type = self.schema.get_type(get_named_type(field.type).name)
-                if not (isinstance(output_type, GraphQLObjectType) and has_given_directive(output_type, "instanceTag")):
-                    errors.append(
+            fields = obj.fields
+
+            # instanceTag field rule
+            if "instanceTag" in fields:
+                field_type = fields["instanceTag"].type
+                references_instance_tag = instance_tag_references.get(field_type)
+                if references_instance_tag is None:
+                    output_type = self.schema.get_type(get_named_type(field_type).name)
+                    references_instance_tag = isinstance(output_type, GraphQLObjectType) and has_given_directive(
+                        output_type, "instanceTag"
+                    )
+                    instance_tag_references[field_type] = references_instance_tag
+                if not references_instance_tag:
+                    instance_tag_field_errors.append(
                         f"[instanceTag] {obj.name}.instanceTag must reference an object type with @instanceTag"
                     )
 
-        # instanceTag object fields must be enums
-        for obj in objects:
-            if has_given_directive(obj, "instanceTag"):
-                for fname, field in obj.fields.items():
-                    if not isinstance(field.type, GraphQLEnumType):
-                        errors.append(f"[instanceTag] {obj.name}.{fname} must be an enum (in @instanceTag object)")
-
-        # generic min/max checks
-        errors += self.check_min_leq_max(objects, "range")
-        errors += self.check_min_leq_max(objects, "cardinality")
+            is_instance_tag_object = has_given_directive(obj, "instanceTag")
+            for fname, field in fields.items():
+                # instanceTag object fields must be enums
+                if is_instance_tag_object and not isinstance(field.type, GraphQLEnumType):
+                    instance_tag_object_errors.append(
+                        f"[instanceTag] {obj.name}.{fname} must be an enum (in @instanceTag object)"
+                    )
+
+                # generic min/max checks
+                check_field_min_leq_max(obj, fname, field, min_max_errors)
+
+        errors = instance_tag_field_errors
+        errors.extend(instance_tag_object_errors)
+        for directive_errors in min_max_errors.values():
+            errors.extend(directive_errors)
 
         # ToDo: NAMING: (Placeholder for naming convention checks)
         # Example: Enforce PascalCase for type names, camelCase for field names
@@ -1,3 +1,4 @@
+import logging
 import subprocess
 from enum import Enum
 from pathlib import Path
@@ -14,6 +15,8 @@ class InspectorCommands(Enum):
 
 
 class InspectorOutput:
+    __slots__ = ("command", "returncode", "output")
+
     def __init__(
         self,
         command: str,
@@ -54,29 +57,31 @@ class GraphQLInspector:
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             **kwargs,
         )
-        stdout = result.stdout.strip() if result.stdout else ""
-        stderr = result.stderr.strip() if result.stderr else ""
-        output = stdout
+        stdout = result.stdout.strip() if result.stdout else b""
+        stderr = result.stderr.strip() if result.stderr else b""
+        output_bytes = stdout
         if stderr:
-            if output:
-                output += "\n" + stderr
+            if output_bytes:
+                output_bytes += b"\n" + stderr
             else:
-                output = stderr
+                output_bytes = stderr
+        output = output_bytes.decode("utf-8", errors="replace")
 
-        if output:
+        inspector_output = InspectorOutput(
+            command=" ".join(cmd),
+            returncode=result.returncode,
+            output=output,
+        )
+
+        if output and log.isEnabledFor(logging.DEBUG):
             log.debug(f"OUTPUT:\n{output}")
         if result.returncode != 0:
             log.warning(f"Command failed with return code {result.returncode}")
         log.info(f"Process completed with return code: {result.returncode}")
 
-        return InspectorOutput(
-            command=" ".join(cmd),
-            returncode=result.returncode,
-            output=output,
-        )
+        return inspector_output
 
     def validate(self, query: str) -> InspectorOutput:
         """Validate schema with logging"""
@@ -1,17 +1,27 @@
 import logging
 import types
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 from typing import cast
 
 from rdflib import Graph, Literal
 from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.sparql import Query
 from rdflib.query import ResultRow
 
 from s2dm.tools.string import normalize_whitespace
 
 # Module-level constant for limit keywords
-NO_LIMIT_KEYWORDS = {"inf", "infinity", "-1", "no", "none", "unlimited", "all"}
+NO_LIMIT_KEYWORDS = frozenset({"inf", "infinity", "-1", "no", "none", "unlimited", "all"})
+
+# Maximum number of search and count results kept per search service
+RESULT_CACHE_SIZE = 128
+
+# Cache key of a search or count: (query kind, keyword, ignore_case, limit_value)
+ResultCacheKey = tuple[str, str, bool, int | None]
 
 
 @dataclass
@@ -53,6 +63,10 @@ class SKOSSearchService:
 
         self.ttl_file_path = ttl_file_path
         self._graph: Graph | None = None
+        # Prepared SPARQL queries keyed by their query text, reused across searches
+        self._prepared_queries: dict[str, Query] = {}
+        # Results of recent searches and counts, least recently used first
+        self._result_cache: OrderedDict[ResultCacheKey, list[SearchResult] | int] = OrderedDict()
 
     @property
     def graph(self) -> Graph:
@@ -80,6 +94,43 @@ class SKOSSearchService:
         if self._graph is not None:
             # Clear the graph reference for garbage collection
             self._graph = None
+        # Cached results belong to the released graph
+        self._result_cache.clear()
+
+    def _prepare_query(self, query_template: str) -> Query:
+        """Prepare a SPARQL query, reusing the prepared query of an identical query text.
+
+        Query texts only vary with the case sensitivity, so a service prepares at most a few queries.
+
+        Args:
+            query_template: The SPARQL query text
+
+        Returns:
+            The prepared query
+        """
+        prepared_query = self._prepared_queries.get(query_template)
+        if prepared_query is None:
+            prepared_query = prepareQuery(query_template)
+            self._prepared_queries[query_template] = prepared_query
+        return prepared_query
+
+    @staticmethod
+    def _result_cache_key(kind: str, keyword: str, ignore_case: bool, limit_value: int | None) -> ResultCacheKey:
+        """Build the result cache key of a query, folding the keyword case for case-insensitive queries."""
+        return (kind, keyword.lower() if ignore_case else keyword, ignore_case, limit_value)
+
+    def _get_cached_result(self, key: ResultCacheKey) -> list[SearchResult] | int | None:
+        """Get a cached result and mark it as most recently used."""
+        result = self._result_cache.get(key)
+        if result is not None:
+            self._result_cache.move_to_end(key)
+        return result
+
+    def _cache_result(self, key: ResultCacheKey, result: list[SearchResult] | int) -> None:
+        """Cache a result, evicting the least recently used one when the cache is full."""
+        self._result_cache[key] = result
+        if len(self._result_cache) > RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
 
     @classmethod
     def parse_limit(cls, limit: int | str) -> int | None:
@@ -122,10 +173,16 @@ class SKOSSearchService:
         if not keyword.strip():
             return 0
 
+        cache_key = self._result_cache_key("count", keyword, ignore_case, None)
+        cached_count = self._get_cached_result(cache_key)
+        if isinstance(cached_count, int):
+            return cached_count
+
         # Build filter conditions based on case sensitivity
+        # For case-insensitive matching the keyword is bound in lower case, so it is not lowered per row
         if ignore_case:
-            subject_filter = "FILTER(CONTAINS(LCASE(STR(?subject)), LCASE(?keyword)))"
-            object_filter = "FILTER(CONTAINS(LCASE(STR(?object)), LCASE(?keyword)))"
+            subject_filter = "FILTER(CONTAINS(LCASE(STR(?subject)), ?keyword))"
+            object_filter = "FILTER(CONTAINS(LCASE(STR(?object)), ?keyword))"
         else:
             subject_filter = "FILTER(CONTAINS(STR(?subject), ?keyword))"
             object_filter = "FILTER(CONTAINS(STR(?object), ?keyword))"
@@ -155,16 +212,20 @@ class SKOSSearchService:
 
         # Prepare and execute count query
         try:
-            prepared_query = prepareQuery(count_query_template)
-            results = self.graph.query(prepared_query, initBindings={"keyword": Literal(keyword)})
+            prepared_query = self._prepare_query(count_query_template)
+            results = self.graph.query(
+                prepared_query, initBindings={"keyword": Literal(keyword.lower() if ignore_case else keyword)}
+            )
 
             # Extract count from result
             for row in results:
                 result_row: ResultRow = cast(ResultRow, row)
                 total_count = int(result_row["total_count"])
                 logging.info(f"Found {total_count} total matches for keyword '{keyword}'")
+                self._cache_result(cache_key, total_count)
                 return total_count
 
+            self._cache_result(cache_key, 0)
             return 0
         except Exception as e:
             logging.error(f"Count query execution failed: {e}")
@@ -192,17 +253,91 @@ class SKOSSearchService:
         if limit_value == 0:
             return []
 
+        cache_key = self._result_cache_key("search", keyword, ignore_case, limit_value)
+        cached_results = self._get_cached_result(cache_key)
+        if isinstance(cached_results, list):
+            # Return a copy, so that callers cannot alter the cached list
+            return list(cached_results)
+
+        query_results = list(self._iter_search_results(keyword, ignore_case, limit_value))
+        search_results = list(self._unique_results(query_results))
+
+        logging.info(f"{len(search_results)} unique matches for keyword '{keyword}' with limit {limit_value}")
+        self._cache_result(cache_key, search_results)
+        if limit_value is None or len(query_results) < limit_value:
+            # All matches were returned, so their number is also the result of the count query
+            self._cache_result(self._result_cache_key("count", keyword, ignore_case, None), len(query_results))
+        return list(search_results)
+
+    def iter_keyword(
+        self, keyword: str, ignore_case: bool = False, limit_value: int | None = 10
+    ) -> Iterator[SearchResult]:
+        """Search for a keyword in SKOS RDF data using SPARQL, yielding the results one by one.
+
+        Behaves like search_keyword, but the query only runs once iteration starts, and the
+        results are not collected into a list (nor added to the result cache).
+
+        Args:
+            keyword: The keyword to search for
+            ignore_case: Whether to perform case-insensitive matching (default: False)
+            limit_value: Maximum number of results to return (None for unlimited, default: 10)
+
+        Yields:
+            SearchResult objects containing matching triples
+        """
+        if not keyword.strip() or limit_value == 0:
+            return
+
+        cached_results = self._get_cached_result(self._result_cache_key("search", keyword, ignore_case, limit_value))
+        if isinstance(cached_results, list):
+            yield from cached_results
+            return
+
+        yield from self._unique_results(self._iter_search_results(keyword, ignore_case, limit_value))
+
+    @staticmethod
+    def _unique_results(results: Iterable[SearchResult]) -> Iterator[SearchResult]:
+        """Skip the results that are the same as a previous one once rendered as strings.
+
+        The search query only removes duplicate RDF terms, so literals differing only in their
+        language tag or in whitespace are removed here.
+
+        Args:
+            results: Search results
+
+        Yields:
+            The search results, without duplicates
+        """
+        seen_results: set[tuple[str, str, str, str]] = set()
+        for result in results:
+            result_key = (result.subject, result.predicate, result.object_value, result.match_type)
+            if result_key not in seen_results:
+                seen_results.add(result_key)
+                yield result
+
+    def _iter_search_results(self, keyword: str, ignore_case: bool, limit_value: int | None) -> Iterator[SearchResult]:
+        """Run the search query for a keyword and yield its results.
+
+        Args:
+            keyword: The keyword to search for
+            ignore_case: Whether to perform case-insensitive matching
+            limit_value: Maximum number of results to return (None for unlimited)
+
+        Yields:
+            SearchResult objects containing matching triples
+        """
         # Use parameterized SPARQL query to prevent injection
         # Build filter conditions based on case sensitivity
+        # For case-insensitive matching the keyword is bound in lower case, so it is not lowered per row
         if ignore_case:
-            subject_filter = "FILTER(CONTAINS(LCASE(STR(?subject)), LCASE(?keyword)))"
-            object_filter = "FILTER(CONTAINS(LCASE(STR(?object)), LCASE(?keyword)))"
+            subject_filter = "FILTER(CONTAINS(LCASE(STR(?subject)), ?keyword))"
+            object_filter = "FILTER(CONTAINS(LCASE(STR(?object)), ?keyword))"
         else:
             subject_filter = "FILTER(CONTAINS(STR(?subject), ?keyword))"
             object_filter = "FILTER(CONTAINS(STR(?object), ?keyword))"
 
         query_template = f"""
-        SELECT ?subject ?predicate ?object ?match_type
+        SELECT DISTINCT ?subject ?predicate ?object ?match_type
         WHERE {{
             {{
                 ?subject ?predicate ?object .
@@ -219,51 +354,37 @@ class SKOSSearchService:
         ORDER BY ?subject ?predicate
         """
 
-        # Add LIMIT clause if needed
-        if limit_value is not None:
-            query_template += f"\nLIMIT {limit_value}"
-
         # Prepare parameterized query
         try:
-            prepared_query = prepareQuery(query_template)
+            prepared_query = self._prepare_query(query_template)
         except Exception as e:
             logging.error(f"SPARQL query preparation failed: {e}")
             raise ValueError(f"Invalid SPARQL query template: {e}") from e
 
         # Execute query
         try:
-            results = self.graph.query(prepared_query, initBindings={"keyword": Literal(keyword)})
+            results = self.graph.query(
+                prepared_query, initBindings={"keyword": Literal(keyword.lower() if ignore_case else keyword)}
+            )
         except Exception as e:
             logging.error(f"SPARQL query execution failed: {e}")
             raise ValueError(f"Search query execution failed: {e}") from e
 
-        # Process results
-        search_results: list[SearchResult] = []
-        seen_triples: set[tuple[str, str, str, str]] = set()  # Track seen triples to avoid duplicates
-
-        for row in results:
+        # Process results, the query already returns each triple of RDF terms only once per match type.
+        # The limit is applied here rather than as a LIMIT clause, so the query text does not depend on it.
+        for row in islice(results, limit_value):
             # Cast to ResultRow to access SPARQL result variables by name
             result_row: ResultRow = cast(ResultRow, row)
-            subject = normalize_whitespace(str(result_row["subject"]))
-            predicate = normalize_whitespace(str(result_row["predicate"]))
+            # Subjects and predicates are IRIs (or blank nodes) and the match type is a fixed keyword,
+            # so only the object, which may be a literal, can contain whitespace to normalize
+            subject = str(result_row["subject"])
+            predicate = str(result_row["predicate"])
             object_value = normalize_whitespace(str(result_row["object"]))
-            match_type = normalize_whitespace(str(result_row["match_type"]))
-
-            # Create a unique key for this triple including match type
-            triple_key = (subject, predicate, object_value, match_type)
-
-            # Skip if we've already seen this exact triple with this match type
-            if triple_key in seen_triples:
-                continue
+            match_type = str(result_row["match_type"])
 
-            seen_triples.add(triple_key)
-            result = SearchResult(
+            yield SearchResult(
                 subject=subject,
                 predicate=predicate,
                 object_value=object_value,
                 match_type=match_type,
             )
-            search_results.append(result)
-
-        logging.info(f"{len(search_results)} unique matches for keyword '{keyword}' with limit {limit_value}")
-        return search_results
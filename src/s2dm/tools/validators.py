@@ -1,7 +1,28 @@
+from functools import lru_cache
+
 import click
 import langcodes
 
 
+@lru_cache(maxsize=256)
+def _get_language_tag_error(value: str) -> str | None:
+    """Validate a language tag against the language data of langcodes.
+
+    Args:
+        value: The language tag to validate
+
+    Returns:
+        None if the language tag is valid, otherwise the error message
+    """
+    try:
+        if not langcodes.get(value).is_valid():
+            return f"'{value}' is not a valid BCP 47 language tag"
+    except ValueError as e:
+        # Handle langcodes.LanguageTagError (inherits from ValueError)
+        return f"'{value}' is not a valid BCP 47 language tag: {str(e)}"
+    return None
+
+
 def validate_language_tag(ctx: click.Context, param: click.Parameter, value: str) -> str:
     """Validate if a given string is compliant to BCP 47 language tag standard.
 
@@ -21,11 +42,8 @@ def validate_language_tag(ctx: click.Context, param: click.Parameter, value: str
         raise click.BadParameter("Language tag cannot be empty")
 
     # Check for valid BCP 47 format using langcodes
-    try:
-        if not langcodes.get(value).is_valid():
-            raise click.BadParameter(f"'{value}' is not a valid BCP 47 language tag")
-    except ValueError as e:
-        # Handle langcodes.LanguageTagError (inherits from ValueError)
-        raise click.BadParameter(f"'{value}' is not a valid BCP 47 language tag: {str(e)}") from None
+    error = _get_language_tag_error(value)
+    if error is not None:
+        raise click.BadParameter(error)
 
     return value
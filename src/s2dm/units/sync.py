@@ -14,18 +14,23 @@ References:
 """
 
 import json
+import os
 import re
 import shutil
-from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 
 import rdflib
 import requests
 from graphql import build_schema
 from packaging import version
-from rdflib.namespace import RDFS
+from rdflib.namespace import RDF, RDFS
+
+from s2dm import log
 
 QUDT_UNITS_TTL_URL_TEMPLATE: str = (
     "https://raw.githubusercontent.com/qudt/qudt-public-repo/{version}/src/main/rdf/vocab/unit/VOCAB_QUDT-UNITS-ALL.ttl"
@@ -38,6 +43,22 @@ QUDT_GITHUB_API_URL: str = "https://api.github.com/repos/qudt/qudt-public-repo/t
 UNITS_META_FILENAME: str = "metadata.json"
 UNITS_META_VERSION_KEY: str = "qudt_quantitykinds_version"
 
+# Directory holding downloaded catalogs, under the user's cache directory
+UNITS_CACHE_DIRNAME: str = "s2dm/qudt"
+
+# Moving QUDT branch, whose catalog is never cached
+QUDT_MAIN_VERSION: str = "main"
+
+
+def _get_cache_dir() -> Path:
+    """Get the directory holding downloaded QUDT catalogs.
+
+    Follows the XDG base directory specification: `$XDG_CACHE_HOME/s2dm/qudt`, or `~/.cache/s2dm/qudt`
+    if `XDG_CACHE_HOME` is not set.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    return (Path(cache_home) if cache_home else Path.home() / ".cache") / UNITS_CACHE_DIRNAME
+
 
 def _extract_uri_segment(uri: str) -> str:
     """Extract the last segment from a URI.
@@ -51,10 +72,16 @@ def _extract_uri_segment(uri: str) -> str:
     return uri.rsplit("/", 1)[-1]
 
 
+# Definition of the @reference directive used by the generated enums, needed to validate them
+REFERENCE_DIRECTIVE_SDL: str = "directive @reference(uri: String!, versionTag: String) on ENUM | ENUM_VALUE\n"
+
 # Precompiled regex utilities to keep transformations DRY
 _DIR_SAFE_RE = re.compile(r"[^0-9A-Za-z_-]+")
 QUDT_NS = rdflib.Namespace("http://qudt.org/schema/qudt/")
 
+# Accepted label languages (English or default), ranked by preference
+LABEL_LANGUAGES: dict[str, int] = {"en": 0, "en-US": 1, "": 2}
+
 
 class UnitEnumError(ValueError):
     """Raised when a unit enum symbol cannot be derived from input.
@@ -78,7 +105,7 @@ class UnitEnumErrorMessages:
 
 @dataclass
 class UnitRow:
-    """A single unit row from the SPARQL result.
+    """A single unit row extracted from the QUDT units catalog.
 
     Attributes:
         unit_iri: IRI of the unit
@@ -134,17 +161,45 @@ def _uri_to_enum_symbol(uri: str) -> str:
     return symbol
 
 
+@lru_cache(maxsize=1024)
 def _quantity_kind_to_enum_type(label: str) -> str:
     """Turn a quantity kind label into an enum type name.
 
     E.g., "Rotary-TranslatoryMotionConversion" -> "RotaryTranslatoryMotionConversionUnitEnum".
+    Memoized, since it is derived again for each file written for a quantity kind.
     """
     label = label.replace("-", "")
     return f"{label}UnitEnum"
 
 
+def _collect_labels(g: rdflib.Graph) -> dict[rdflib.term.Node, str]:
+    """Collect the English (or default language) label of every labelled subject in a single pass.
+
+    Labels tagged "en" are preferred over "en-US", which are preferred over untagged ones.
+    Labels in other languages are ignored.
+
+    Args:
+        g: RDFLib graph containing the labelled subjects
+
+    Returns:
+        Mapping of subjects to their preferred label
+    """
+    labels: dict[rdflib.term.Node, str] = {}
+    label_ranks: dict[rdflib.term.Node, int] = {}
+    for subject, _, label in g.triples((None, RDFS.label, None)):
+        rank = LABEL_LANGUAGES.get(getattr(label, "language", None) or "")
+        if rank is not None and rank < label_ranks.get(subject, len(LABEL_LANGUAGES)):
+            labels[subject] = str(label)
+            label_ranks[subject] = rank
+    return labels
+
+
 def _query_units(g: rdflib.Graph) -> list[UnitRow]:
-    """Run SPARQL over the graph to extract units and their quantity kinds.
+    """Extract units and their quantity kinds from the graph.
+
+    Walks the quantity kind triples directly and looks labels up in a mapping collected up front,
+    instead of running a SPARQL query, since RDFLib's query engine is slow for the optional label
+    and UCUM code lookups.
 
     Args:
         g: RDFLib graph containing QUDT units catalog
@@ -152,42 +207,19 @@ def _query_units(g: rdflib.Graph) -> list[UnitRow]:
     Returns:
         List of UnitRow items
     """
+    units = set(g.subjects(RDF.type, QUDT_NS.Unit))
+    # Filter out deprecated units (e.g., unit:Standard which is replaced by unit:STANDARD)
+    # This prevents duplicate GraphQL enum symbols from deprecated/replacement unit pairs
+    units.difference_update(g.subjects(QUDT_NS.deprecated, rdflib.Literal(True)))
 
-    # Filter for language labels (English or default)
-    query = f"""
-    PREFIX qudt: <{QUDT_NS}>
-    PREFIX rdfs: <{RDFS}>
-
-    SELECT DISTINCT ?unit ?unitLabel ?qk ?qkLabel ?ucumCode
-    WHERE {{
-      ?unit a qudt:Unit .
-      ?unit qudt:hasQuantityKind ?qk .
-
-      # Filter out deprecated units (e.g., unit:Standard which is replaced by unit:STANDARD)
-      # This prevents duplicate GraphQL enum symbols from deprecated/replacement unit pairs
-      FILTER NOT EXISTS {{ ?unit qudt:deprecated true }}
-
-      OPTIONAL {{
-        ?unit rdfs:label ?unitLabel .
-        FILTER(lang(?unitLabel) = "en" || lang(?unitLabel) = "en-US" || lang(?unitLabel) = "")
-      }}
-      OPTIONAL {{
-        ?qk rdfs:label ?qkLabel .
-        FILTER(lang(?qkLabel) = "en" || lang(?qkLabel) = "en-US" || lang(?qkLabel) = "")
-      }}
-      OPTIONAL {{ ?unit qudt:ucumCode ?ucumCode }}
-    }}
-    """
-
+    labels = _collect_labels(g)
     seen_units: dict[tuple[str, str], UnitRow] = {}  # (symbol, qk_iri) -> UnitRow
 
-    for row in g.query(query):
-        unit_iri = str(row[0])  # type: ignore[index]
-        unit_label = str(row[1]) if row[1] else ""  # type: ignore[index]
-        qk_iri = str(row[2])  # type: ignore[index]
-        qk_label = str(row[3]) if row[3] else _extract_uri_segment(qk_iri)  # type: ignore[index,misc]
-        ucum_code = str(row[4]) if row[4] else None  # type: ignore[index,misc]
+    for unit, _, qk in g.triples((None, QUDT_NS.hasQuantityKind, None)):
+        if unit not in units:
+            continue
 
+        unit_iri = str(unit)
         try:
             # Use URI-based symbol generation (always reliable)
             symbol = _uri_to_enum_symbol(unit_iri)
@@ -196,20 +228,23 @@ def _query_units(g: rdflib.Graph) -> list[UnitRow]:
             continue
 
         # Deduplicate based on symbol and quantity kind IRI to prevent duplicate enum values
+        qk_iri = str(qk)
         unit_key = (symbol, qk_iri)
-        unit_row = UnitRow(
+        ucum_code = next((str(code) for code in g.objects(unit, QUDT_NS.ucumCode)), None)
+
+        # Prefer entries with UCUM codes when deduplicating
+        if unit_key in seen_units and (not ucum_code or seen_units[unit_key].ucum_code):
+            continue
+
+        seen_units[unit_key] = UnitRow(
             unit_iri=unit_iri,
-            unit_label=unit_label,
+            unit_label=labels.get(unit, ""),
             quantity_kind_iri=qk_iri,
-            quantity_kind_label=qk_label,
+            quantity_kind_label=labels.get(qk) or _extract_uri_segment(qk_iri),
             symbol=symbol,
             ucum_code=ucum_code,
         )
 
-        # Prefer entries with UCUM codes when deduplicating
-        if unit_key not in seen_units or (ucum_code and not seen_units[unit_key].ucum_code):
-            seen_units[unit_key] = unit_row
-
     return list(seen_units.values())
 
 
@@ -221,20 +256,17 @@ def _emit_enum_sdl(quantity_kind_label: str, quantity_kind_iri: str, unit_rows:
 
     Note: We use a custom SDL generation approach instead of graphql-core's print_type()
     because we need to include custom @reference directives that are not supported by
-    the standard GraphQL specification. The generated SDL is validated using graphql-core's
-    build_schema() to ensure correctness.
+    the standard GraphQL specification. The generated SDL is validated separately with
+    `_validate_enum_sdls`, so that all enums of a sync are checked in a single pass.
 
     Args:
         quantity_kind_label: Human-readable label for the quantity kind (e.g., "Velocity")
         quantity_kind_iri: QUDT IRI for the quantity kind
-        unit_rows: Unit data for enum values
+        unit_rows: Unit data for enum values, sorted by symbol
         version: QUDT version for documentation and version tag
 
     Returns:
-        Valid GraphQL SDL string with custom @reference directives including versionTag
-
-    Raises:
-        UnitEnumError: If the generated SDL is not valid GraphQL
+        GraphQL SDL string with custom @reference directives including versionTag
     """
     enum_type = _quantity_kind_to_enum_type(quantity_kind_label)
 
@@ -243,29 +275,26 @@ def _emit_enum_sdl(quantity_kind_label: str, quantity_kind_iri: str, unit_rows:
         f'enum {enum_type} @reference(uri: "{quantity_kind_iri}", versionTag: "{version}") {{',
     ]
 
-    for row in sorted(unit_rows, key=lambda r: r.symbol):
+    # Each enum value is a single two-line block, and blocks are separated by an empty line for readability
+    value_blocks = []
+    for row in unit_rows:
         # Build description string with label and UCUM code
-        description_parts = []
-        if row.unit_label:
-            description_parts.append(row.unit_label)
-        if row.ucum_code:
-            description_parts.append(f"UCUM: {row.ucum_code}")
-
-        description = " | ".join(description_parts) if description_parts else row.symbol
+        if row.unit_label and row.ucum_code:
+            description = f"{row.unit_label} | UCUM: {row.ucum_code}"
+        elif row.ucum_code:
+            description = f"UCUM: {row.ucum_code}"
+        else:
+            description = row.unit_label or row.symbol
 
-        lines.append(f'  """{description}"""')
-        lines.append(f'  {row.symbol} @reference(uri: "{row.unit_iri}", versionTag: "{version}")')
-        lines.append("")  # Empty line for readability
+        value_blocks.append(
+            f'  """{description}"""\n  {row.symbol} @reference(uri: "{row.unit_iri}", versionTag: "{version}")'
+        )
 
-    # Remove the last empty line and add closing brace
-    if lines and lines[-1] == "":
-        lines.pop()
+    if value_blocks:
+        lines.append("\n\n".join(value_blocks))
     lines.append("}")
 
-    # Generate the SDL and validate it
-    sdl = "\n".join(lines) + "\n"
-    _validate_enum_sdl(sdl, enum_type)
-    return sdl
+    return "\n".join(lines) + "\n"
 
 
 def _validate_enum_sdl(sdl: str, enum_type: str) -> None:
@@ -279,22 +308,42 @@ def _validate_enum_sdl(sdl: str, enum_type: str) -> None:
         UnitEnumError: If the SDL is not valid GraphQL
     """
     try:
-        # Add the @reference directive definition needed for validation
-        sdl_with_directive = f"""
-directive @reference(uri: String!, versionTag: String) on ENUM | ENUM_VALUE
-
-{sdl}
-"""
-        build_schema(sdl_with_directive)
+        build_schema(f"{REFERENCE_DIRECTIVE_SDL}\n{sdl}")
     except Exception as e:
         raise UnitEnumError(f"{UnitEnumErrorMessages.INVALID_SDL.format(enum_type=enum_type)}: {e}") from e
 
 
+def _validate_enum_sdls(enum_sdls: Iterable[tuple[str, str]]) -> None:
+    """Validate the generated SDL of several enums at once.
+
+    The enums are built into a single schema, so that graphql-core runs once instead of once per enum.
+    Only if that fails, they are validated one by one to report the invalid enum. Enums that are only
+    invalid together (e.g. duplicate type names) are accepted, as when each enum was validated alone.
+    Enums with the same type name are written to the same `<EnumType>.graphql` file, so the last one
+    overwrites the others.
+
+    Args:
+        enum_sdls: Pairs of enum type names and their SDL strings
+
+    Raises:
+        UnitEnumError: If the SDL of an enum is not valid GraphQL
+    """
+    enum_sdls = list(enum_sdls)
+    try:
+        build_schema("\n".join([REFERENCE_DIRECTIVE_SDL, *(sdl for _, sdl in enum_sdls)]))
+    except Exception:
+        for enum_type, sdl in enum_sdls:
+            _validate_enum_sdl(sdl, enum_type)
+
+
 def _write_units(units_root: Path, quantity_kind_label: str, sdl: str) -> Path:
     """Write enum SDL to `/units/<quantityKind>/<QuantityKind>_Unit_Enum.graphql`.
 
+    A file that already holds the same SDL is left untouched, so that its modification time
+    only changes when its content does.
+
     Args:
-        units_root: Root directory for units
+        units_root: Root directory for units, which must already exist
         quantity_kind_label: Label used to build directory and enum file names
         sdl: GraphQL SDL content
 
@@ -302,9 +351,12 @@ def _write_units(units_root: Path, quantity_kind_label: str, sdl: str) -> Path:
         Path of the written file
     """
     enum_type = _quantity_kind_to_enum_type(quantity_kind_label)
-    target_dir = units_root
-    target_dir.mkdir(parents=True, exist_ok=True)
-    target_file = target_dir / f"{enum_type}.graphql"
+    target_file = units_root / f"{enum_type}.graphql"
+    try:
+        if target_file.read_text(encoding="utf-8") == sdl:
+            return target_file
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
     target_file.write_text(sdl, encoding="utf-8")
     return target_file
 
@@ -318,71 +370,131 @@ def _write_metadata(units_root: Path, version: str) -> Path:
     return meta_path
 
 
-def _load_graph_from_url(url: str) -> rdflib.Graph:
-    """Load a TTL file from a URL directly into an RDFLib graph.
+def _load_graph_from_url(url: str, cache_file: Path | None = None, *, write_cache: bool = True) -> rdflib.Graph:
+    """Load a TTL file from a URL into an RDFLib graph.
 
     Args:
         url: Direct raw URL to a TTL resource
+        cache_file: Optional file holding a previously downloaded copy of the TTL. It is read
+            instead of downloading the TTL if it exists, and written after a successful download otherwise.
+            A cached copy that cannot be parsed is downloaded again.
+        write_cache: If False, the cache file is only read and a download is not written to it
     Returns:
         Parsed RDF graph
+
+    Raises:
+        UnitEnumError: If the TTL cannot be downloaded
     """
+    if cache_file is not None and cache_file.is_file():
+        g = rdflib.Graph()
+        try:
+            g.parse(data=cache_file.read_bytes(), format="turtle")
+            return g
+        except Exception as e:
+            log.warning(f"Ignoring unreadable cached QUDT units catalog '{cache_file}': {e}")
+
+    try:
+        resp = requests.get(url, timeout=60)
+        resp.raise_for_status()
+    except requests.RequestException as e:
+        raise UnitEnumError(f"Failed to download QUDT units catalog from {url}: {e}") from e
+
     g = rdflib.Graph()
-    # RDFLib can parse remote URLs directly when given a format
-    g.parse(url, format="turtle")
+    g.parse(data=resp.content, format="turtle")
+
+    # Only cache the download once it parsed, and write it atomically so that an interrupted
+    # write never leaves a truncated TTL behind
+    if cache_file is not None and write_cache:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f"{cache_file.suffix}.tmp")
+        tmp_file.write_bytes(resp.content)
+        tmp_file.replace(cache_file)
     return g
 
 
-def sync_qudt_units(units_root: Path, version: str, *, dry_run: bool = False) -> list[Path]:
+def _clean_units_dir(units_root: Path, keep: Collection[str] = ()) -> None:
+    """Remove stale files from the units directory.
+
+    Args:
+        units_root: Root directory for units
+        keep: Names of the entries to keep
+    """
+    # scandir reports the entry types from the directory listing, so no entry needs to be stat'ed
+    with os.scandir(units_root) as entries:
+        for entry in entries:
+            if entry.name in keep:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
+def sync_qudt_units(units_root: Path, version: str, *, dry_run: bool = False, validate: bool = True) -> list[Path]:
     """Fetch QUDT quantity kinds TTL and generate GraphQL enums per quantity kind.
 
-    Cleans up existing unit enum files before generating new ones to prevent stale data.
+    Unit enum files of previous syncs that are not generated again are removed to prevent stale data,
+    and files whose content did not change are not rewritten.
+    The catalog of tagged versions is cached in the user's cache directory (see `_get_cache_dir`)
+    and reused by later syncs. Dry runs read a cached catalog, but do not add one to the cache.
 
     Args:
         units_root: Root `/units/` target directory
         version: QUDT version string. If None, use main branch (latest moving target)
         dry_run: If True, process data but don't write files (for counting/testing)
+        validate: If True, check that the generated enums are valid GraphQL before writing them
     Returns:
         List of enum file paths that were written (or would be written in dry-run mode)
-    """
-    # Clean up existing files before sync (but not during dry run)
-    if not dry_run and units_root.exists():
-        try:
-            shutil.rmtree(units_root)
-        except OSError as e:
-            raise UnitEnumError(f"Failed to clean up units directory: {e}") from e
 
+    Raises:
+        UnitEnumError: If the catalog cannot be downloaded, the units directory cannot be cleaned up,
+            or a generated enum is not valid GraphQL
+    """
     url = QUDT_UNITS_TTL_URL_TEMPLATE.format(version=version)
 
-    g = _load_graph_from_url(url)
-    rows = _query_units(g)
+    # Tagged catalogs never change, so they are downloaded only once
+    cache_file = None
+    if version != QUDT_MAIN_VERSION:
+        cache_file = _get_cache_dir() / f"qudt-units-{_DIR_SAFE_RE.sub('_', version)}.ttl"
 
-    # Group rows by quantity kind label
-    grouped: dict[str, list[UnitRow]] = defaultdict(list)
-    for row in rows:
-        grouped[row.quantity_kind_label].append(row)
+    g = _load_graph_from_url(url, cache_file, write_cache=not dry_run)
+    rows = _query_units(g)
 
-    written: list[Path] = []
+    # Sort rows once by quantity kind label and symbol, so that grouping them by quantity kind
+    # yields each group in the order its enum values are emitted
+    rows.sort(key=attrgetter("quantity_kind_label", "symbol"))
 
-    for qk_label, items in grouped.items():
-        if not items:  # Skip empty groups
-            continue
+    enum_sdls: list[tuple[str, str]] = []
+    for qk_label, group in groupby(rows, key=attrgetter("quantity_kind_label")):
+        items = list(group)
         qk_iri = items[0].quantity_kind_iri
-        sdl = _emit_enum_sdl(qk_label, qk_iri, items, version)
+        enum_sdls.append((qk_label, _emit_enum_sdl(qk_label, qk_iri, items, version)))
 
-        if dry_run:
-            # Simulate the file path that would be written without actually writing
-            enum_type = _quantity_kind_to_enum_type(qk_label)
-            target_file = units_root / f"{enum_type}.graphql"
-            written.append(target_file)
-        else:
-            written.append(_write_units(units_root, qk_label, sdl))
+    # Validate all enums before writing any of them
+    if validate:
+        _validate_enum_sdls((_quantity_kind_to_enum_type(qk_label), sdl) for qk_label, sdl in enum_sdls)
+
+    written: list[Path]
+    if dry_run:
+        # Simulate the file paths that would be written without actually writing
+        written = [units_root / f"{_quantity_kind_to_enum_type(qk_label)}.graphql" for qk_label, _ in enum_sdls]
+    else:
+        # All enum files go to the units root, so it is created once for all of them
+        units_root.mkdir(parents=True, exist_ok=True)
+        written = [_write_units(units_root, qk_label, sdl) for qk_label, sdl in enum_sdls]
 
     if not dry_run:
+        # Remove the files of previous syncs which were not generated again, to prevent stale data
+        try:
+            if units_root.exists():
+                _clean_units_dir(units_root, keep={path.name for path in written} | {UNITS_META_FILENAME})
+        except OSError as e:
+            raise UnitEnumError(f"Failed to clean up units directory: {e}") from e
         _write_metadata(units_root, version)
     return written
 
 
-def get_latest_qudt_version(fallback: str = "main") -> str:
+def get_latest_qudt_version(fallback: str = QUDT_MAIN_VERSION) -> str:
     """Return a string representing the latest known QUDT tag for the public repo.
 
     Minimal, non-overengineered approach: read Git tags via GitHub's tags API.
@@ -129,3 +129,33 @@ def test_cardinality_min_gt_max() -> None:
     checker = ConstraintChecker(schema)
     errors = checker.run(objects)
     assert any("has min > max" in e for e in errors)
+
+
+def test_errors_are_grouped_by_rule() -> None:
+    sdl = """
+    directive @instanceTag on OBJECT
+    directive @range(min: Float, max: Float) on FIELD_DEFINITION
+    directive @cardinality(min: Int, max: Int) on FIELD_DEFINITION
+
+    type Bar {
+      baz: Int @cardinality(min: 3, max: 2) @range(min: 10, max: 5)
+    }
+
+    type TagObj @instanceTag {
+      notEnum: String
+    }
+
+    type Foo {
+      instanceTag: Bar
+    }
+    """
+    schema = make_schema(sdl)
+    objects = get_objects(schema)
+    checker = ConstraintChecker(schema)
+    errors = checker.run(objects)
+    assert [e.split()[0] + " " + e.split()[1] for e in errors] == [
+        "[instanceTag] Foo.instanceTag",
+        "[instanceTag] TagObj.notEnum",
+        "[range] Bar.baz",
+        "[cardinality] Bar.baz",
+    ]
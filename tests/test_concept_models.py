@@ -0,0 +1,26 @@
+import json
+from io import StringIO
+from pathlib import Path
+
+from s2dm.concept.models import ConceptUriModel
+from s2dm.concept.services import (
+    convert_concept_uri_to_spec_history,
+    create_concept_uri_model,
+    create_jsonld_context,
+    iter_all_concepts,
+)
+from s2dm.exporters.utils.extraction import get_all_named_types
+from s2dm.exporters.utils.schema_loader import load_schema
+
+
+def test_write_json_ld_matches_json_dump(schema_path: list[Path]) -> None:
+    """Test that streaming the JSON-LD writes the same document as dumping it at once."""
+    concepts = iter_all_concepts(get_all_named_types(load_schema(schema_path)))
+    concept_uri_model = create_concept_uri_model(concepts, "https://example.org/vss#", "ns")
+    spec_history = convert_concept_uri_to_spec_history(concept_uri_model, {})
+    empty_model = ConceptUriModel(context=create_jsonld_context("https://example.org/vss#"), graph=[])
+
+    for model in (concept_uri_model, spec_history, empty_model):
+        stream = StringIO()
+        model.write_json_ld(stream)
+        assert stream.getvalue() == json.dumps(model.to_json_ld(), indent=2)
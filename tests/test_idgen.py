@@ -1,14 +1,18 @@
 import ast
+import copy
+import dataclasses
+import io
+import json
 from collections.abc import Callable
 
 import pytest
 from faker import Faker
-from graphql import GraphQLNamedType
+from graphql import GraphQLList, GraphQLNamedType, GraphQLString, build_schema
 from hypothesis import given
 
-from s2dm.exporters.id import IDExporter
+from s2dm.exporters.id import IDExporter, write_node_ids
 from s2dm.idgen.idgen import fnv1_32_wrapper
-from s2dm.idgen.models import IDGenerationSpec
+from s2dm.idgen.models import FieldTypeWrapper, IDGenerationSpec
 from tests.conftest import (
     MockFieldData,
     mock_named_types_strategy,
@@ -139,3 +143,52 @@ def test_id_generation_changes_with_field_changes_for_non_enum_field(
 
     assert changed_id is not None
     assert changed_id != initial_id
+
+
+def test_id_export_exits_on_repeated_id(faker: Faker, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the export fails on any repeated ID, even when the node name is repeated as well."""
+    id_spec = MockFieldData.non_enum_field_data(faker).expected_id_spec()
+    exporter = IDExporter(schema=build_schema("type Query { id: ID }"), output=None, strict_mode=True, dry_run=True)
+    monkeypatch.setattr(exporter, "iter_all_id_specs", lambda named_types: iter([id_spec, id_spec]))
+
+    with pytest.raises(SystemExit):
+        exporter.run()
+
+
+def test_id_spec_hash_and_node_identifier(faker: Faker) -> None:
+    """Test that copies share the hash and node identifier, and that changed fields change the identifier."""
+    id_spec = MockFieldData.non_enum_field_data(faker).expected_id_spec()
+    node_identifier = id_spec.get_node_identifier_bytes(strict_mode=True)
+    assert id_spec.get_node_identifier_bytes(strict_mode=False) == node_identifier.lower()
+
+    id_spec_copy = copy.copy(id_spec)
+    assert id_spec_copy == id_spec
+    assert hash(id_spec_copy) == hash(id_spec)
+    assert id_spec_copy.get_node_identifier_bytes(strict_mode=True) == node_identifier
+
+    renamed_id_spec = dataclasses.replace(id_spec, name=f"{id_spec.name}Renamed")
+    assert renamed_id_spec.get_node_identifier_bytes(strict_mode=True) != node_identifier
+
+
+def test_id_spec_data_type_of_nested_lists() -> None:
+    """Test that each nested list wrapper adds a list suffix to the data type."""
+    assert IDGenerationSpec._resolve_data_type(FieldTypeWrapper(GraphQLString)) == "string"
+    assert IDGenerationSpec._resolve_data_type(FieldTypeWrapper(GraphQLList(GraphQLString))) == "string[]"
+    assert (
+        IDGenerationSpec._resolve_data_type(FieldTypeWrapper(GraphQLList(GraphQLList(GraphQLString)))) == "string[][]"
+    )
+
+
+@pytest.mark.parametrize(
+    "node_ids",
+    [{}, {"Vehicle.speed": "0x1A2B3C4D"}, {"Vehicle.speed": "0x1A2B3C4D", 'Seat.h\u00e9ight"': "0x0000000F"}],
+)
+def test_write_node_ids_matches_indented_json_dump(node_ids: dict[str, str]) -> None:
+    """Test that the written IDs are the same as an indented JSON dump."""
+    expected = io.StringIO()
+    json.dump(node_ids, expected, indent=2)
+
+    written = io.StringIO()
+    write_node_ids(node_ids, written)
+
+    assert written.getvalue() == expected.getvalue()
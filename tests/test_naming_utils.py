@@ -189,9 +189,8 @@ class TestConvertFieldNames:
             fields={"TestField": GraphQLField(GraphQLString), "AnotherTestField": GraphQLField(GraphQLString)},
         )
 
-        naming_config = {"field": {"object": "camelCase"}}
         schema = GraphQLSchema(query=object_type)
-        convert_field_names(object_type, naming_config, schema)
+        convert_field_names(object_type, schema, "camelCase", None)
 
         assert "testField" in object_type.fields
         assert "anotherTestField" in object_type.fields
@@ -202,9 +201,8 @@ class TestConvertFieldNames:
         """Test field conversion works for interface types."""
         interface_type = GraphQLInterfaceType(name="TestInterface", fields={"TestField": GraphQLField(GraphQLString)})
 
-        naming_config = {"field": {"interface": "snake_case"}}
         schema = GraphQLSchema(query=GraphQLObjectType(name="Query", fields={}))
-        convert_field_names(interface_type, naming_config, schema)
+        convert_field_names(interface_type, schema, "snake_case", None)
 
         assert "test_field" in interface_type.fields
         assert "TestField" not in interface_type.fields
@@ -213,9 +211,8 @@ class TestConvertFieldNames:
         """Test field conversion works for input types."""
         input_type = GraphQLInputObjectType(name="TestInput", fields={"TestField": GraphQLInputField(GraphQLString)})
 
-        naming_config = {"field": {"input": "kebab-case"}}
         schema = GraphQLSchema(query=GraphQLObjectType(name="Query", fields={}))
-        convert_field_names(input_type, naming_config, schema)
+        convert_field_names(input_type, schema, "kebab-case", None)
 
         assert "test-field" in input_type.fields
         assert "TestField" not in input_type.fields
@@ -232,9 +229,8 @@ class TestConvertFieldNames:
             },
         )
 
-        naming_config = {"argument": {"field": "MACROCASE"}}
         schema = GraphQLSchema(query=object_type)
-        convert_field_names(object_type, naming_config, schema)
+        convert_field_names(object_type, schema, None, "MACROCASE")
 
         field_args = object_type.fields["testField"].args
         assert "TEST_ARG" in field_args
@@ -243,11 +239,11 @@ class TestConvertFieldNames:
         assert "AnotherArg" not in field_args
 
     def test_no_conversion_when_no_config(self) -> None:
-        """Test that fields remain unchanged when no config is provided."""
+        """Test that fields remain unchanged when no target case is given."""
         object_type = GraphQLObjectType(name="TestObject", fields={"TestField": GraphQLField(GraphQLString)})
 
         schema = GraphQLSchema(query=object_type)
-        convert_field_names(object_type, {}, schema)
+        convert_field_names(object_type, schema, None, None)
 
         assert "TestField" in object_type.fields
 
@@ -261,8 +257,7 @@ class TestConvertFieldNames:
 
         door_type.fields["regularField"] = GraphQLField(GraphQLString)
 
-        naming_config = {"field": {"object": "camelCase"}}
-        convert_field_names(door_type, naming_config, schema)
+        convert_field_names(door_type, schema, "camelCase", None)
 
         assert "instanceTag" in door_type.fields
         assert "instancetag" not in door_type.fields
@@ -286,8 +281,7 @@ class TestConvertEnumValues:
             },
         )
 
-        naming_config = {"enumValue": "PascalCase"}
-        convert_enum_values(enum_type, naming_config)
+        convert_enum_values(enum_type, "PascalCase")
 
         assert "OldValue" in enum_type.values
         assert "AnotherOldValue" in enum_type.values
@@ -299,17 +293,16 @@ class TestConvertEnumValues:
         enum_value = GraphQLEnumValue("OLD_VALUE", description="Test description")
         enum_type = GraphQLEnumType(name="TestEnum", values={"OLD_VALUE": enum_value})
 
-        naming_config = {"enumValue": "camelCase"}
-        convert_enum_values(enum_type, naming_config)
+        convert_enum_values(enum_type, "camelCase")
 
         converted_value = enum_type.values["oldValue"]
         assert converted_value.description == "Test description"
 
     def test_no_conversion_when_no_config(self) -> None:
-        """Test that enum values remain unchanged when no config is provided."""
+        """Test that enum values remain unchanged when no target case is given."""
         enum_type = GraphQLEnumType(name="TestEnum", values={"OLD_VALUE": GraphQLEnumValue("OLD_VALUE")})
 
-        convert_enum_values(enum_type, {})
+        convert_enum_values(enum_type, None)
 
         assert "OLD_VALUE" in enum_type.values
 
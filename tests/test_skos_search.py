@@ -138,6 +138,23 @@ class TestSKOSSearchService:
 
         assert len(results) > 0
 
+    def test_search_deduplicates_rendered_literals(self) -> None:
+        """Test that literals differing only in their language tag or whitespace are returned once."""
+        ttl = """
+@prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+@prefix ns: <https://example.org/vss#> .
+
+ns:Seat skos:altLabel "Seat row"@en, "Seat row"@de, "Seat  row" .
+"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".ttl", delete=False) as f:
+            f.write(ttl)
+            ttl_path = Path(f.name)
+
+        with SKOSSearchService(ttl_path) as service:
+            results = service.search_keyword("row", limit_value=None)
+            assert [result.object_value for result in results] == ["Seat row"]
+            assert list(service.iter_keyword("row", limit_value=None)) == results
+
     @pytest.mark.parametrize(
         "limit,expected_behavior",
         [
@@ -258,3 +275,67 @@ class TestSKOSSearchService:
 
         # Graph should be cleaned up
         assert service._graph is None
+
+    def test_prepared_queries_are_reused(self, search_service: SKOSSearchService) -> None:
+        """Test that repeated searches reuse the prepared SPARQL queries."""
+        from unittest.mock import patch
+
+        search_service.search_keyword("Vehicle", ignore_case=True)
+        search_service.count_keyword_matches("Vehicle", ignore_case=True)
+
+        with patch("s2dm.tools.skos_search.prepareQuery", side_effect=Exception("SPARQL error")):
+            results = search_service.search_keyword("Engine", ignore_case=True)
+            assert {result.subject for result in results} == {"https://example.org/vss#Engine"}
+            assert search_service.count_keyword_matches("Engine", ignore_case=True) == len(results)
+
+    def test_prepared_queries_do_not_depend_on_limit(self, search_service: SKOSSearchService) -> None:
+        """Test that searches with different limits share one prepared query and still respect their limit."""
+        all_results = search_service.search_keyword("Vehicle", limit_value=None)
+        for limit_value in range(1, len(all_results) + 2):
+            assert search_service.search_keyword("Vehicle", limit_value=limit_value) == all_results[:limit_value]
+
+        assert len(search_service._prepared_queries) == 1
+
+    def test_results_are_cached(self, search_service: SKOSSearchService) -> None:
+        """Test that repeated searches are answered from the result cache until the service is closed."""
+        from unittest.mock import patch
+
+        expected_results = search_service.search_keyword("Vehicle", ignore_case=True)
+        expected_count = search_service.count_keyword_matches("Vehicle", ignore_case=True)
+
+        with patch.object(search_service.graph, "query", side_effect=Exception("Query exec error")):
+            results = search_service.search_keyword("VEHICLE", ignore_case=True)
+            assert results == expected_results
+            assert search_service.count_keyword_matches("vehicle", ignore_case=True) == expected_count
+
+            # The returned list is a copy of the cached one
+            results.clear()
+            assert search_service.search_keyword("Vehicle", ignore_case=True) == expected_results
+
+            # Case-sensitive searches and other limits are cached separately
+            with pytest.raises(ValueError, match="Search query execution failed"):
+                search_service.search_keyword("Vehicle", ignore_case=False)
+            with pytest.raises(ValueError, match="Search query execution failed"):
+                search_service.search_keyword("Vehicle", ignore_case=True, limit_value=None)
+
+        search_service.__exit__(None, None, None)
+        assert not search_service._result_cache
+
+    def test_count_is_known_from_complete_search(self, search_service: SKOSSearchService) -> None:
+        """Test that a search returning all matches also answers the count without another query."""
+        from unittest.mock import patch
+
+        results = search_service.search_keyword("Vehicle", ignore_case=True, limit_value=100)
+        assert 0 < len(results) < 100
+
+        with patch.object(search_service.graph, "query", side_effect=Exception("Query exec error")):
+            assert search_service.count_keyword_matches("Vehicle", ignore_case=True) == len(results)
+
+    def test_iter_keyword(self, search_service: SKOSSearchService) -> None:
+        """Test that iterating over the results yields the same results as the search."""
+        streamed_results = list(search_service.iter_keyword("Vehicle", ignore_case=True, limit_value=None))
+        assert streamed_results == search_service.search_keyword("Vehicle", ignore_case=True, limit_value=None)
+        assert streamed_results
+        assert list(search_service.iter_keyword("Vehicle", ignore_case=True, limit_value=None)) == streamed_results
+        assert list(search_service.iter_keyword("   ")) == []
+        assert list(search_service.iter_keyword("Vehicle", limit_value=0)) == []
@@ -8,16 +8,20 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
+import rdflib
+from graphql import build_schema
 
 from s2dm.units.sync import (
     UnitEnumError,
     UnitEnumErrorMessages,
     UnitRow,
     _extract_uri_segment,
+    _load_graph_from_url,
+    _query_units,
     _uri_to_enum_symbol,
     sync_qudt_units,
 )
-from tests.conftest import MOCK_QUDT_VERSION, QUDT_UNIT_BASE, create_test_unit_row
+from tests.conftest import MOCK_QUDT_VERSION, QUDT_QK_BASE, QUDT_UNIT_BASE, create_test_unit_row
 
 
 @pytest.mark.parametrize(
@@ -83,6 +87,14 @@ def test_uri_to_enum_symbol_invalid(invalid_uri: str, expected_message_key: str)
         _uri_to_enum_symbol(invalid_uri)
 
 
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the downloaded catalogs of the tests out of the user's cache directory."""
+    cache_home = tmp_path / "cache-home"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
 @pytest.fixture
 def mock_sync_setup() -> Iterator[tuple[Mock, Mock]]:
     """Set up common mocks for sync tests."""
@@ -188,3 +200,158 @@ def test_sync_with_cleanup(
     # Test 2: Normal sync removes old file
     sync_qudt_units(units_dir, MOCK_QUDT_VERSION, dry_run=False)
     assert not old_file.exists()
+
+
+def test_query_units() -> None:
+    """Test that units are extracted with their preferred labels, skipping deprecated units."""
+    graph = rdflib.Graph()
+    graph.parse(
+        data=f"""
+        @prefix qudt: <http://qudt.org/schema/qudt/> .
+        @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+        @prefix unit: <{QUDT_UNIT_BASE}/> .
+        @prefix quantitykind: <{QUDT_QK_BASE}/> .
+
+        unit:M-PER-SEC a qudt:Unit ;
+            rdfs:label "Meter pro Sekunde"@de, "meter per second"@en-US, "Meter per Second"@en ;
+            qudt:hasQuantityKind quantitykind:Velocity, quantitykind:LinearVelocity ;
+            qudt:ucumCode "m.s-1" .
+        unit:KiloGM a qudt:Unit ;
+            rdfs:label "Kilogram" ;
+            qudt:hasQuantityKind quantitykind:Mass .
+        unit:Standard a qudt:Unit ;
+            qudt:deprecated true ;
+            qudt:hasQuantityKind quantitykind:Mass .
+        unit:NotAUnit qudt:hasQuantityKind quantitykind:Mass .
+        quantitykind:Velocity rdfs:label "Velocity"@en .
+        quantitykind:Mass rdfs:label "Masse"@de .
+        """,
+        format="turtle",
+    )
+
+    rows = sorted(_query_units(graph), key=lambda row: (row.symbol, row.quantity_kind_label))
+
+    assert [(row.symbol, row.unit_label, row.quantity_kind_label, row.ucum_code) for row in rows] == [
+        ("KILOGM", "Kilogram", "Mass", None),
+        ("M_PER_SEC", "Meter per Second", "LinearVelocity", "m.s-1"),
+        ("M_PER_SEC", "Meter per Second", "Velocity", "m.s-1"),
+    ]
+
+
+def test_load_graph_from_url_cache(tmp_path: Path) -> None:
+    """Test that a cached catalog is parsed instead of downloading it again."""
+    ttl = f'<{QUDT_UNIT_BASE}/M> <http://www.w3.org/2000/01/rdf-schema#label> "Meter"@en .\n'
+    cache_file = tmp_path / ".cache" / "qudt-units.ttl"
+
+    with patch("s2dm.units.sync.requests.get") as mock_get:
+        mock_get.return_value = Mock(content=ttl.encode("utf-8"))
+        first_graph = _load_graph_from_url("https://example.com/units.ttl", cache_file)
+        second_graph = _load_graph_from_url("https://example.com/units.ttl", cache_file)
+
+    mock_get.assert_called_once()
+    assert cache_file.read_text(encoding="utf-8") == ttl
+    assert len(first_graph) == len(second_graph) == 1
+
+
+def test_load_graph_from_url_corrupt_cache(tmp_path: Path) -> None:
+    """Test that a cached catalog which cannot be parsed is downloaded again."""
+    ttl = f'<{QUDT_UNIT_BASE}/M> <http://www.w3.org/2000/01/rdf-schema#label> "Meter"@en .\n'
+    cache_file = tmp_path / "qudt-units.ttl"
+    cache_file.write_text("<truncated", encoding="utf-8")
+
+    with patch("s2dm.units.sync.requests.get") as mock_get:
+        mock_get.return_value = Mock(content=ttl.encode("utf-8"))
+        graph = _load_graph_from_url("https://example.com/units.ttl", cache_file)
+
+    mock_get.assert_called_once()
+    assert len(graph) == 1
+    assert cache_file.read_text(encoding="utf-8") == ttl
+
+
+def test_load_graph_from_url_read_only_cache(tmp_path: Path) -> None:
+    """Test that a read-only cache is used if present, but a download is not written to it."""
+    ttl = f'<{QUDT_UNIT_BASE}/M> <http://www.w3.org/2000/01/rdf-schema#label> "Meter"@en .\n'
+    cache_file = tmp_path / "qudt-units.ttl"
+
+    with patch("s2dm.units.sync.requests.get") as mock_get:
+        mock_get.return_value = Mock(content=ttl.encode("utf-8"))
+        _load_graph_from_url("https://example.com/units.ttl", cache_file, write_cache=False)
+        assert not cache_file.exists()
+
+        cache_file.write_text(ttl, encoding="utf-8")
+        graph = _load_graph_from_url("https://example.com/units.ttl", cache_file, write_cache=False)
+
+    mock_get.assert_called_once()
+    assert len(graph) == 1
+
+
+def test_sync_caches_catalog_outside_units_dir(
+    tmp_path: Path,
+    cache_home: Path,
+    mock_sync_setup: tuple[Mock, Mock],
+    single_unit: list[UnitRow],
+) -> None:
+    """Test that the catalog of a tagged version is cached in the user's cache directory, and main is not cached.
+
+    Dry runs read the cache without adding to it.
+    """
+    mock_query_units, mock_load_graph = mock_sync_setup
+    mock_query_units.return_value = single_unit
+
+    sync_qudt_units(tmp_path / "units", MOCK_QUDT_VERSION)
+    assert mock_load_graph.call_args.args[1].parent == cache_home / "s2dm" / "qudt"
+
+    assert mock_load_graph.call_args.kwargs["write_cache"] is True
+
+    sync_qudt_units(tmp_path / "units", MOCK_QUDT_VERSION, dry_run=True)
+    assert mock_load_graph.call_args.args[1].parent == cache_home / "s2dm" / "qudt"
+    assert mock_load_graph.call_args.kwargs["write_cache"] is False
+
+    sync_qudt_units(tmp_path / "units", "main")
+    assert mock_load_graph.call_args.args[1] is None
+
+
+def test_sync_validates_all_enums_at_once(
+    mock_sync_setup: tuple[Mock, Mock],
+    sample_units: list[UnitRow],
+    tmp_path: Path,
+) -> None:
+    """Test that the generated enums are validated in a single pass, reporting the invalid enum on failure."""
+    mock_query_units, _ = mock_sync_setup
+    mock_query_units.return_value = sample_units
+
+    with patch("s2dm.units.sync.build_schema", wraps=build_schema) as mock_build_schema:
+        sync_qudt_units(tmp_path / "units", MOCK_QUDT_VERSION, dry_run=True)
+    assert mock_build_schema.call_count == 1
+
+    with patch("s2dm.units.sync.build_schema") as mock_build_schema:
+        sync_qudt_units(tmp_path / "units", MOCK_QUDT_VERSION, dry_run=True, validate=False)
+    mock_build_schema.assert_not_called()
+
+    mock_query_units.return_value = [*sample_units, create_test_unit_row("Meter", "Length-", "meter", "m")]
+    mock_query_units.return_value[-1].quantity_kind_label = "Invalid Label"
+    with pytest.raises(UnitEnumError, match="Invalid LabelUnitEnum"):
+        sync_qudt_units(tmp_path / "units", MOCK_QUDT_VERSION)
+    assert not list((tmp_path / "units").glob("*.graphql")), "No enum should be written if one of them is invalid"
+
+
+def test_sync_keeps_unchanged_files(
+    tmp_path: Path,
+    mock_sync_setup: tuple[Mock, Mock],
+    sample_units: list[UnitRow],
+) -> None:
+    """Test that syncing again does not rewrite enum files whose content did not change."""
+    mock_query_units, _ = mock_sync_setup
+    mock_query_units.return_value = sample_units
+
+    units_root = tmp_path / "units"
+    first_paths = sync_qudt_units(units_root, MOCK_QUDT_VERSION)
+    mtimes = {path: path.stat().st_mtime_ns for path in first_paths}
+
+    with patch.object(Path, "write_text", autospec=True, side_effect=Path.write_text) as mock_write_text:
+        second_paths = sync_qudt_units(units_root, MOCK_QUDT_VERSION)
+
+    assert second_paths == first_paths
+    assert {path: path.stat().st_mtime_ns for path in second_paths} == mtimes
+    written_files = {call.args[0] for call in mock_write_text.call_args_list}
+    assert written_files.isdisjoint(first_paths)
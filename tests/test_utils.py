@@ -1,7 +1,7 @@
 from pathlib import Path
 from typing import Any, cast
 
-from graphql import parse
+from graphql import build_schema, parse
 from graphql.type import GraphQLObjectType
 
 from s2dm.exporters.utils import directive as directive_utils
@@ -112,6 +112,10 @@ def test_get_all_object_types(schema_path: list[Path]) -> None:
     object_types = extraction_utils.get_all_object_types(schema)
     assert any(o.name == "Query" for o in object_types)
 
+    non_root_object_types = extraction_utils.get_all_object_types(schema, skip_root_types=True)
+    assert not any(o.name == "Query" for o in non_root_object_types)
+    assert len(non_root_object_types) == len(object_types) - 1
+
 
 def test_get_all_objects_with_directive(schema_path: list[Path]) -> None:
     schema = schema_loader_utils.load_schema(schema_path)
@@ -227,6 +231,24 @@ def test_has_given_directive(schema_path: list[Path]) -> None:
         break
 
 
+def test_get_directives_by_name() -> None:
+    schema = build_schema(
+        """
+        directive @range(min: Float, max: Float) on FIELD_DEFINITION
+        directive @metadata(comment: String) on FIELD_DEFINITION
+        type Query { speed: Float @range(min: 0, max: 250) @metadata(comment: "km/h") }
+        """
+    )
+    field = cast(GraphQLObjectType, schema.type_map["Query"]).fields["speed"]
+
+    directives_by_name = directive_utils.get_directives_by_name(field)
+    assert list(directives_by_name) == ["range", "metadata"]
+    assert directive_utils.get_directive(field, "metadata") is directives_by_name["metadata"]
+    assert directive_utils.get_directive(field, "deprecated") is None
+    assert directive_utils.has_given_directive(field, "metadata")
+    assert directive_utils.get_directive_arguments(field, "range") == {"min": 0, "max": 250}
+
+
 # #########################################################
 # Field utils
 # #########################################################
@@ -0,0 +1,78 @@
+from io import StringIO
+from pathlib import Path
+
+from s2dm.exporters.utils.schema_loader import load_and_process_schema
+from s2dm.exporters.vspec import TopLevelLineBreakWriter, reconstruct_paths, translate_to_vspec
+
+
+class TestReconstructPaths:
+    """Test reconstruction of VSS branch paths from nested type relationships."""
+
+    def test_reconstruct_paths_nested(self) -> None:
+        """Test that all prefixes of the nested paths are returned sorted."""
+        nested_types = [("Vehicle", "Cabin"), ("Cabin", "Door"), ("Vehicle", "Body")]
+        assert reconstruct_paths(nested_types) == [
+            "Vehicle",
+            "Vehicle.Body",
+            "Vehicle.Cabin",
+            "Vehicle.Cabin.Door",
+        ]
+
+    def test_reconstruct_paths_cycle(self) -> None:
+        """Test that cyclic relationships terminate instead of recursing forever."""
+        nested_types = [("Vehicle", "Cabin"), ("Cabin", "Seat"), ("Seat", "Cabin")]
+        assert reconstruct_paths(nested_types) == ["Vehicle", "Vehicle.Cabin", "Vehicle.Cabin.Seat"]
+
+    def test_reconstruct_paths_deep(self) -> None:
+        """Test that deep hierarchies do not hit the recursion limit."""
+        depth = 5000
+        nested_types = [(f"T{i}", f"T{i + 1}") for i in range(depth)]
+        paths = reconstruct_paths(nested_types)
+        assert len(paths) == depth + 1
+
+
+def test_translate_to_vspec_stream(schema_path: list[Path]) -> None:
+    """Test that streaming the YAML produces the same output as the returned string."""
+    annotated_schema, _, _ = load_and_process_schema(schema_path)
+    expected = translate_to_vspec(annotated_schema)
+
+    stream = StringIO()
+    assert translate_to_vspec(annotated_schema, stream) is None
+    assert stream.getvalue() == expected
+    assert "Vehicle:" in expected
+
+
+class RecordingStream(StringIO):
+    """String stream recording every chunk written to it."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.chunks: list[str] = []
+
+    def write(self, data: str) -> int:
+        self.chunks.append(data)
+        return super().write(data)
+
+
+def test_translate_to_vspec_stream_writes_chunks(tmp_path: Path) -> None:
+    """Test that a large YAML is written to the stream in chunks instead of as one complete string."""
+    fields = "\n".join(f'  "Field number {i}."\n  field{i}: Float' for i in range(1000))
+    schema_file = tmp_path / "large.graphql"
+    schema_file.write_text(f"type Query {{\n  vehicle: Vehicle\n}}\n\ntype Vehicle {{\n{fields}\n}}\n")
+    annotated_schema, _, _ = load_and_process_schema([schema_file])
+    expected = translate_to_vspec(annotated_schema)
+
+    stream = RecordingStream()
+    translate_to_vspec(annotated_schema, stream)
+    assert len(stream.chunks) > 1
+    assert all(len(chunk) < len(expected) for chunk in stream.chunks)
+    assert stream.getvalue() == expected
+
+
+def test_top_level_line_break_writer_across_chunks() -> None:
+    """Test that a top-level key starting a chunk is separated from the previous entry."""
+    stream = StringIO()
+    writer = TopLevelLineBreakWriter(stream)
+    for chunk in ["A:\n  type: branch\n", "A.b:\n  type: ", "sensor\nA.c:\n", "  type: actuator\n"]:
+        writer.write(chunk)
+    assert stream.getvalue() == "A:\n  type: branch\n\nA.b:\n  type: sensor\n\nA.c:\n  type: actuator\n"